@@ -0,0 +1,57 @@
+"""
+Optional compiled kernels for hot numeric loops.
+
+When numba is installed, the column-statistics kernel runs as a
+parallel JIT-compiled loop using Welford's numerically stable online
+algorithm, fusing the mean/variance/count passes and allocating no
+temporaries. Without numba it degrades to an equivalent vectorized
+NumPy implementation, so callers never need to care which is active.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _column_stats_numpy(matrix: np.ndarray):
+    """NaN-safe per-column mean, sample stdev, and count via NumPy."""
+    present = ~np.isnan(matrix)
+    counts = present.sum(axis=0)
+    means = np.where(present, matrix, 0.0).sum(axis=0) / np.maximum(counts, 1)
+    squares = np.where(present, (matrix - means) ** 2, 0.0).sum(axis=0)
+    stdevs = np.sqrt(squares / np.maximum(counts - 1, 1))
+    return means, stdevs, counts
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _column_stats_welford(matrix):  # pragma: no cover - needs numba
+        n_rows, n_cols = matrix.shape
+        means = np.zeros(n_cols)
+        stdevs = np.zeros(n_cols)
+        counts = np.zeros(n_cols, dtype=np.int64)
+
+        for j in prange(n_cols):
+            mean = 0.0
+            m2 = 0.0
+            count = 0
+            for i in range(n_rows):
+                x = matrix[i, j]
+                if not np.isnan(x):
+                    count += 1
+                    delta = x - mean
+                    mean += delta / count
+                    m2 += (x - mean) * delta
+            counts[j] = count
+            means[j] = mean
+            stdevs[j] = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+
+        return means, stdevs, counts
+
+    column_stats = _column_stats_welford
+else:
+    column_stats = _column_stats_numpy
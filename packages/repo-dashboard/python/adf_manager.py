@@ -11,7 +11,6 @@ from typing import Dict, List, Tuple, Any
 from pathlib import Path
 import jsonschema
 from jsonschema import validate, ValidationError
-import yaml
 
 
 # ADF JSON Schema Definition
@@ -301,6 +300,9 @@ class ADFManager:
         if format == "json":
             return json.dumps(adf, indent=2, ensure_ascii=False)
         elif format == "yaml":
+            # Imported lazily: most callers only ever export JSON, and
+            # loading PyYAML at module import slows every cold start
+            import yaml
             return yaml.dump(adf, default_flow_style=False, allow_unicode=True)
         elif format == "graphml":
             return ADFManager._export_graphml(adf)
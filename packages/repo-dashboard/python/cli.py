@@ -8,6 +8,7 @@ aggregating metrics, generating C4 diagrams, and analyzing learning patterns.
 import click
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -25,6 +26,61 @@ load_dotenv()
 # Get GitHub token from environment
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', '')
 
+# Parent directories already created during this invocation. Batch runs
+# (e.g. generating diagrams for every repo) hit the same output directory
+# repeatedly; caching avoids the redundant stat/mkdir syscalls.
+_MKDIR_CACHE: set = set()
+
+
+def _ensure_parent(path: str) -> None:
+    """Create the parent directory of path (once per unique parent)."""
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent not in _MKDIR_CACHE:
+        Path(parent).mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+
+
+class _OutputFile(click.File):
+    """Output file parameter: lazy atomic writer that creates parent dirs.
+
+    The file is only opened on first write (so failed commands leave no
+    partial output) and written atomically via rename on close.
+    """
+
+    def __init__(self):
+        super().__init__(mode='w', encoding='utf-8', lazy=True, atomic=True)
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, (str, os.PathLike)):
+            _ensure_parent(os.fspath(value))
+        return super().convert(value, param, ctx)
+
+
+def _summarize_adf(adf_data: dict) -> str:
+    """Build a compact summary of an ADF instead of dumping the whole doc."""
+    architecture = adf_data.get('architecture', {})
+    containers = architecture.get('c4Model', {}).get('containers', [])
+    relationships = architecture.get('relationships', [])
+    type_counts = {}
+    for container in containers:
+        container_type = container.get('type', 'unknown')
+        type_counts[container_type] = type_counts.get(container_type, 0) + 1
+    return (
+        f"  Name: {architecture.get('name', 'N/A')}\n"
+        f"  Version: {adf_data.get('version', 'N/A')}\n"
+        f"  Containers: {len(containers)}\n"
+        f"  Relationships: {len(relationships)}\n"
+        f"  Container types: {type_counts}"
+    )
+
+
+def _write_json(data, output, compact: bool) -> None:
+    """Write JSON output, compact (fast/small) or indented (human-readable)."""
+    if compact:
+        json.dump(data, output, separators=(',', ':'), default=str)
+    else:
+        json.dump(data, output, indent=2, default=str)
+
 
 @click.group()
 @click.version_option(version='1.0.0')
@@ -50,15 +106,20 @@ def adf():
 @adf.command()
 @click.option('--file', required=True, help='ADF file path')
 @click.option('--verbose', is_flag=True, help='Verbose output')
-def load(file: str, verbose: bool):
+@click.option('--dump-json', is_flag=True, help='Dump full ADF JSON (paged)')
+def load(file: str, verbose: bool, dump_json: bool):
     """Load and validate ADF from file"""
     try:
         adf_data = ADFManager.load_adf(file)
         if verbose:
             click.echo(f"✓ Loaded ADF from {file}")
-            click.echo(json.dumps(adf_data, indent=2))
+            click.echo(_summarize_adf(adf_data))
         else:
             click.echo(f"✓ Successfully loaded ADF from {file}")
+        if dump_json:
+            # Paged output streams in chunks instead of buffering the
+            # entire serialized document through the terminal at once
+            click.echo_via_pager(json.dumps(adf_data, indent=2))
     except Exception as e:
         click.echo(f"✗ Error loading ADF: {str(e)}", err=True)
         raise click.Exit(1)
@@ -91,7 +152,7 @@ def validate(file: str, verbose: bool):
 
 @adf.command()
 @click.option('--org', required=True, help='GitHub organization')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 @click.option('--token', default=GITHUB_TOKEN, help='GitHub token')
 def generate(org: str, output: str, token: str):
     """Generate ADF from repository metadata"""
@@ -102,8 +163,8 @@ def generate(org: str, output: str, token: str):
     try:
         click.echo(f"Generating ADF for organization: {org}...")
         adf_data = ADFManager.generate_adf_from_repos(org, token)
-        ADFManager.save_adf(adf_data, output)
-        click.echo(f"✓ ADF generated and saved to {output}")
+        json.dump(adf_data, output, indent=2, ensure_ascii=False)
+        click.echo(f"✓ ADF generated and saved to {output.name}")
     except Exception as e:
         click.echo(f"✗ Error generating ADF: {str(e)}", err=True)
         raise click.Exit(1)
@@ -112,7 +173,7 @@ def generate(org: str, output: str, token: str):
 @adf.command()
 @click.option('--file', required=True, help='ADF file path')
 @click.option('--format', type=click.Choice(['json', 'yaml', 'graphml']), default='json', help='Export format')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 def export(file: str, format: str, output: str):
     """Export ADF to different formats"""
     try:
@@ -125,11 +186,9 @@ def export(file: str, format: str, output: str):
         elif format == 'graphml':
             content = ADFManager.export_adf(adf_data, 'graphml')
         
-        Path(output).parent.mkdir(parents=True, exist_ok=True)
-        with open(output, 'w') as f:
-            f.write(content)
-        
-        click.echo(f"✓ ADF exported to {output} in {format.upper()} format")
+        output.write(content)
+
+        click.echo(f"✓ ADF exported to {output.name} in {format.upper()} format")
     except Exception as e:
         click.echo(f"✗ Error exporting ADF: {str(e)}", err=True)
         raise click.Exit(1)
@@ -137,14 +196,16 @@ def export(file: str, format: str, output: str):
 
 @adf.command()
 @click.option('--files', multiple=True, required=True, help='ADF file paths to merge')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 def merge(files: tuple, output: str):
     """Merge multiple ADF files"""
     try:
-        adf_list = [ADFManager.load_adf(f) for f in files]
+        # Loads are I/O-bound (file read + JSON parse), so overlap them
+        with ThreadPoolExecutor(max_workers=min(16, len(files))) as executor:
+            adf_list = list(executor.map(ADFManager.load_adf, files))
         merged = ADFManager.merge_adfs(adf_list)
-        ADFManager.save_adf(merged, output)
-        click.echo(f"✓ Merged {len(files)} ADF files into {output}")
+        json.dump(merged, output, indent=2, ensure_ascii=False)
+        click.echo(f"✓ Merged {len(files)} ADF files into {output.name}")
     except Exception as e:
         click.echo(f"✗ Error merging ADFs: {str(e)}", err=True)
         raise click.Exit(1)
@@ -162,24 +223,23 @@ def metrics():
 
 @metrics.command()
 @click.option('--org', required=True, help='GitHub organization')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 @click.option('--token', default=GITHUB_TOKEN, help='GitHub token')
-def aggregate(org: str, output: str, token: str):
+@click.option('--compact', is_flag=True, help='Emit compact JSON (no indentation)')
+def aggregate(org: str, output: str, token: str, compact: bool):
     """Aggregate metrics for organization"""
     if not token:
         click.echo("✗ GitHub token required. Set GITHUB_TOKEN environment variable.", err=True)
         raise click.Exit(1)
-    
+
     try:
         click.echo(f"Aggregating metrics for organization: {org}...")
         aggregator = MetricsAggregator(org, token)
         metrics_data = aggregator.aggregate_repository_metrics(org)
-        
-        Path(output).parent.mkdir(parents=True, exist_ok=True)
-        with open(output, 'w') as f:
-            json.dump(metrics_data, f, indent=2, default=str)
-        
-        click.echo(f"✓ Metrics aggregated and saved to {output}")
+
+        _write_json(metrics_data, output, compact)
+
+        click.echo(f"✓ Metrics aggregated and saved to {output.name}")
     except Exception as e:
         click.echo(f"✗ Error aggregating metrics: {str(e)}", err=True)
         raise click.Exit(1)
@@ -188,24 +248,23 @@ def aggregate(org: str, output: str, token: str):
 @metrics.command()
 @click.option('--org', required=True, help='GitHub organization')
 @click.option('--days', default=30, help='Number of days to retrieve')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 @click.option('--token', default=GITHUB_TOKEN, help='GitHub token')
-def history(org: str, days: int, output: str, token: str):
+@click.option('--compact', is_flag=True, help='Emit compact JSON (no indentation)')
+def history(org: str, days: int, output: str, token: str, compact: bool):
     """Get metrics history"""
     if not token:
         click.echo("✗ GitHub token required. Set GITHUB_TOKEN environment variable.", err=True)
         raise click.Exit(1)
-    
+
     try:
         click.echo(f"Retrieving metrics history for {org} (last {days} days)...")
         aggregator = MetricsAggregator(org, token)
         history_data = aggregator.get_metrics_history(org, days)
-        
-        Path(output).parent.mkdir(parents=True, exist_ok=True)
-        with open(output, 'w') as f:
-            json.dump(history_data, f, indent=2, default=str)
-        
-        click.echo(f"✓ Metrics history saved to {output}")
+
+        _write_json(history_data, output, compact)
+
+        click.echo(f"✓ Metrics history saved to {output.name}")
     except Exception as e:
         click.echo(f"✗ Error retrieving metrics history: {str(e)}", err=True)
         raise click.Exit(1)
@@ -214,7 +273,7 @@ def history(org: str, days: int, output: str, token: str):
 @metrics.command()
 @click.option('--org', required=True, help='GitHub organization')
 @click.option('--format', type=click.Choice(['json', 'csv']), default='json', help='Export format')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 @click.option('--token', default=GITHUB_TOKEN, help='GitHub token')
 def export_metrics(org: str, format: str, output: str, token: str):
     """Export metrics to different formats"""
@@ -226,17 +285,15 @@ def export_metrics(org: str, format: str, output: str, token: str):
         click.echo(f"Exporting metrics for {org}...")
         storage = StorageManager()
         
-        Path(output).parent.mkdir(parents=True, exist_ok=True)
-        
         if format == 'csv':
-            storage.export_metrics_csv(org, output)
+            # CSV export writes the file itself, so hand it the target path
+            storage.export_metrics_csv(org, output.name)
         else:
             aggregator = MetricsAggregator(org, token)
             metrics_data = aggregator.aggregate_repository_metrics(org)
-            with open(output, 'w') as f:
-                json.dump(metrics_data, f, indent=2, default=str)
-        
-        click.echo(f"✓ Metrics exported to {output} in {format.upper()} format")
+            json.dump(metrics_data, output, indent=2, default=str)
+
+        click.echo(f"✓ Metrics exported to {output.name} in {format.upper()} format")
     except Exception as e:
         click.echo(f"✗ Error exporting metrics: {str(e)}", err=True)
         raise click.Exit(1)
@@ -256,14 +313,15 @@ def c4():
 @click.option('--adf', required=True, help='ADF file path')
 @click.option('--level', type=click.Choice(['system', 'container', 'component', 'code']), default='container', help='C4 level')
 @click.option('--format', type=click.Choice(['mermaid', 'plantuml', 'graphml', 'json']), default='mermaid', help='Output format')
-@click.option('--output', required=True, help='Output file path')
-def generate_diagram(adf: str, level: str, format: str, output: str):
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
+@click.option('--compact', is_flag=True, help='Emit compact JSON (no indentation)')
+def generate_diagram(adf: str, level: str, format: str, output: str, compact: bool):
     """Generate C4 diagram from ADF"""
     try:
         click.echo(f"Generating {level} {format.upper()} diagram...")
         adf_data = ADFManager.load_adf(adf)
         generator = C4ModelGenerator(adf_data)
-        
+
         if format == 'mermaid':
             content = generator.generate_mermaid(level)
         elif format == 'plantuml':
@@ -271,13 +329,16 @@ def generate_diagram(adf: str, level: str, format: str, output: str):
         elif format == 'graphml':
             content = generator.generate_graphml()
         elif format == 'json':
-            content = json.dumps(generator.generate_json_graph(), indent=2)
-        
-        Path(output).parent.mkdir(parents=True, exist_ok=True)
-        with open(output, 'w') as f:
-            f.write(content)
+            # Compact output is faster to serialize and smaller on disk,
+            # which matters when downstream visualizers consume the graph
+            if compact:
+                content = json.dumps(generator.generate_json_graph(), separators=(',', ':'))
+            else:
+                content = json.dumps(generator.generate_json_graph(), indent=2)
         
-        click.echo(f"✓ Diagram generated and saved to {output}")
+        output.write(content)
+
+        click.echo(f"✓ Diagram generated and saved to {output.name}")
     except Exception as e:
         click.echo(f"✗ Error generating diagram: {str(e)}", err=True)
         raise click.Exit(1)
@@ -296,27 +357,26 @@ def learning():
 @learning.command()
 @click.option('--org', required=True, help='GitHub organization')
 @click.option('--days', default=90, help='Number of days to analyze')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 @click.option('--token', default=GITHUB_TOKEN, help='GitHub token')
-def analyze(org: str, days: int, output: str, token: str):
+@click.option('--compact', is_flag=True, help='Emit compact JSON (no indentation)')
+def analyze(org: str, days: int, output: str, token: str, compact: bool):
     """Analyze patterns in metrics"""
     if not token:
         click.echo("✗ GitHub token required. Set GITHUB_TOKEN environment variable.", err=True)
         raise click.Exit(1)
-    
+
     try:
         click.echo(f"Analyzing patterns for {org} (last {days} days)...")
         aggregator = MetricsAggregator(org, token)
         history_data = aggregator.get_metrics_history(org, days)
-        
+
         analyzer = LearningAnalyzer(history_data)
         analysis = analyzer.analyze_patterns()
-        
-        Path(output).parent.mkdir(parents=True, exist_ok=True)
-        with open(output, 'w') as f:
-            json.dump(analysis, f, indent=2, default=str)
-        
-        click.echo(f"✓ Analysis saved to {output}")
+
+        _write_json(analysis, output, compact)
+
+        click.echo(f"✓ Analysis saved to {output.name}")
     except Exception as e:
         click.echo(f"✗ Error analyzing patterns: {str(e)}", err=True)
         raise click.Exit(1)
@@ -325,7 +385,7 @@ def analyze(org: str, days: int, output: str, token: str):
 @learning.command()
 @click.option('--org', required=True, help='GitHub organization')
 @click.option('--days', default=90, help='Number of days to analyze')
-@click.option('--output', required=True, help='Output file path')
+@click.option('--output', required=True, type=_OutputFile(), help='Output file path')
 @click.option('--token', default=GITHUB_TOKEN, help='GitHub token')
 def report(org: str, days: int, output: str, token: str):
     """Generate learning report"""
@@ -341,11 +401,9 @@ def report(org: str, days: int, output: str, token: str):
         analyzer = LearningAnalyzer(history_data)
         report_content = analyzer.generate_report()
         
-        Path(output).parent.mkdir(parents=True, exist_ok=True)
-        with open(output, 'w') as f:
-            f.write(report_content)
-        
-        click.echo(f"✓ Report generated and saved to {output}")
+        output.write(report_content)
+
+        click.echo(f"✓ Report generated and saved to {output.name}")
     except Exception as e:
         click.echo(f"✗ Error generating report: {str(e)}", err=True)
         raise click.Exit(1)
@@ -5,15 +5,30 @@ Migrates issues from one GitHub repository to another with full metadata preserv
 Supports issue extraction, transformation, and creation with source attribution.
 """
 
+import itertools
 import os
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import operator
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# orjson parses GitHub's nested issue payloads several times faster than
+# stdlib json; fall back silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,62 +36,243 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bounded concurrency for issue creation, within GitHub's guideline of
+# ~10 concurrent write requests
+MAX_CONCURRENT_POSTS = 8
+
+# Extracts the last page number from GitHub's Link response header
+_LINK_LAST_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Parse a response body, preferring orjson when installed."""
+    if orjson is not None and isinstance(response.content, bytes):
+        return orjson.loads(response.content)
+    return response.json()
+
+# GraphQL query fetching exactly the fields transform_issue consumes,
+# instead of the fully-expanded REST issue payload
+_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $pageSize: Int!, $cursor: String, $states: [IssueState!]) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $pageSize, after: $cursor, states: $states,
+           orderBy: {field: UPDATED_AT, direction: ASC}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number
+        title
+        body
+        state
+        url
+        createdAt
+        author { login }
+        labels(first: 20) { nodes { name } }
+        assignees(first: 10) { nodes { login } }
+        milestone { title }
+      }
+    }
+  }
+}
+"""
+
+
+class _RateLimitRetry(Retry):
+    """Retry strategy that sleeps until GitHub's rate-limit reset.
+
+    GitHub tells clients exactly when to retry via Retry-After and
+    X-RateLimit-Reset, so there is no point in blind exponential backoff
+    when the rate limit is the cause.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is not None:
+            return retry_after
+
+        headers = getattr(response, 'headers', None) or {}
+        if headers.get('X-RateLimit-Remaining') == '0':
+            reset = headers.get('X-RateLimit-Reset')
+            if reset:
+                return max(0, int(reset) - time.time())
+        return None
+
+
+class _TokenPool:
+    """Thread-safe round-robin pool of API tokens.
+
+    Each token carries its own rate-limit quota, so rotating requests
+    across several tokens multiplies effective throughput without any
+    one of them tripping the limit sooner.
+    """
+
+    def __init__(self, tokens: List[str]):
+        self._cycle = itertools.cycle(tokens)
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        with self._lock:
+            return next(self._cycle)
+
 
 class GitHubAPIClient:
     """GitHub API client with retry logic and rate limiting awareness."""
-    
-    def __init__(self, token: str, base_url: str = "https://api.github.com"):
-        self.token = token
+
+    def __init__(self, token, base_url: str = "https://api.github.com"):
+        # A single token string keeps the historical behaviour; a list
+        # of tokens enables round-robin rotation per request
+        tokens = [token] if isinstance(token, str) else list(token)
+        self.token = tokens[0]
+        self._token_pool = _TokenPool(tokens) if len(tokens) > 1 else None
+        token = self.token
         self.base_url = base_url
+        # Headers never change for the lifetime of the client, so build the
+        # dict once; the session carries it on every request
+        self._headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "issue-migrator"
+        }
         self.session = self._create_session()
         self.rate_limit_remaining = None
         self.rate_limit_reset = None
+        # Search and core endpoints have independent quotas (30/min vs
+        # 5000/h); track them per resource so one doesn't mask the other
+        self.rate_limit_by_resource: Dict[str, int] = {}
+        self.last_response_headers = None
+        # ETag cache per endpoint: conditional GETs answered with 304 are
+        # free (no rate-limit charge) and skip retransferring the payload
+        self._etag_cache: Dict[str, Dict[str, Any]] = {}
+        # Prepared-request templates per POST URL: header merging and URL
+        # parsing happen once, repeat POSTs just clone and swap the body
+        self._post_templates: Dict[str, requests.PreparedRequest] = {}
+        # Client-wide bound on in-flight writes: batch runs fan several
+        # per-repo POST pools out over one shared client, and without
+        # this gate their combined concurrency would exceed both the
+        # ~10-concurrent-writes guideline and the adapter's pool size
+        self._post_semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_POSTS)
     
     def _create_session(self) -> requests.Session:
-        """Create a requests session with retry strategy."""
+        """Create a requests session with retry strategy and pooling."""
         session = requests.Session()
-        retry_strategy = Retry(
+        retry_strategy = _RateLimitRetry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Explicit pool sizing so concurrent fetches/POSTs reuse TCP+TLS
+        # connections instead of paying a handshake per request. The pool
+        # is sized from the worker-pool bound so every in-flight request
+        # can hold a pooled connection without evicting another.
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=4,
+            pool_maxsize=2 * MAX_CONCURRENT_POSTS,
+            pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
+        # Default headers on the session keep keep-alive semantics intact
+        session.headers.update(self._get_headers())
+        # Set GH_HTTP_DEBUG to verify pool reuse: only one
+        # "Starting new HTTPS connection" line should appear per host
+        if os.getenv('GH_HTTP_DEBUG'):
+            logging.getLogger('urllib3.connectionpool').setLevel(logging.DEBUG)
         return session
     
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authentication."""
-        return {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "issue-migrator"
-        }
+        """Get the cached request headers with authentication."""
+        return self._headers
     
     def _update_rate_limit(self, response: requests.Response) -> None:
         """Update rate limit info from response headers."""
         self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
         self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
-        
+        resource = response.headers.get('X-RateLimit-Resource', 'core')
+        self.rate_limit_by_resource[resource] = self.rate_limit_remaining
+
         if self.rate_limit_remaining < 10:
             logger.warning(f"⚠️ Rate limit low: {self.rate_limit_remaining} requests remaining")
+
+        # Proactively wait out the window when nearly exhausted, instead of
+        # failing the rest of the batch and burning retries
+        if self.rate_limit_remaining < 5 and self.rate_limit_reset:
+            wait = self.rate_limit_reset - time.time()
+            if wait > 0:
+                logger.warning(f"⏳ Sleeping {wait:.0f}s until rate limit reset")
+                time.sleep(min(wait, 3600))
     
     def get(self, endpoint: str) -> Dict[str, Any]:
         """Make a GET request to GitHub API."""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.get(url, headers=self._get_headers())
+
+        cached = self._etag_cache.get(endpoint)
+        extra = {'If-None-Match': cached['etag']} if cached else None
+        if self._token_pool is not None:
+            extra = dict(extra or {})
+            extra['Authorization'] = f"token {self._token_pool.next()}"
+
+        response = self.session.get(url, headers=extra)
+        self.last_response_headers = response.headers
         self._update_rate_limit(response)
+
+        if cached and response.status_code == 304:
+            return cached['body']
+
         response.raise_for_status()
-        return response.json()
+        body = _parse_json(response)
+
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[endpoint] = {'etag': etag, 'body': body}
+
+        return body
     
     def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a POST request to GitHub API."""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.post(url, headers=self._get_headers(), json=data)
+
+        template = self._post_templates.get(url)
+        if template is None:
+            request = requests.Request(
+                'POST', url, headers={'Content-Type': 'application/json'}
+            )
+            template = self.session.prepare_request(request)
+            self._post_templates[url] = template
+
+        if orjson:
+            body = orjson.dumps(data)
+        else:
+            body = json.dumps(data).encode('utf-8')
+
+        prepared = template.copy()
+        prepared.body = body
+        prepared.headers['Content-Length'] = str(len(body))
+        if self._token_pool is not None:
+            prepared.headers['Authorization'] = f"token {self._token_pool.next()}"
+
+        with self._post_semaphore:
+            response = self.session.send(prepared)
+        self._update_rate_limit(response)
+        response.raise_for_status()
+        return _parse_json(response)
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make a request to the GitHub GraphQL API and return its data."""
+        extra = None
+        if self._token_pool is not None:
+            extra = {'Authorization': f"token {self._token_pool.next()}"}
+        response = self.session.post(
+            f"{self.base_url}/graphql",
+            json={'query': query, 'variables': variables or {}},
+            headers=extra
+        )
         self._update_rate_limit(response)
         response.raise_for_status()
-        return response.json()
+        body = response.json()
+        if body.get('errors'):
+            raise requests.exceptions.RequestException(f"GraphQL errors: {body['errors']}")
+        return body.get('data', {})
 
 
 class IssueExtractor:
@@ -86,74 +282,293 @@ class IssueExtractor:
         self.client = client
     
     def fetch_issues(self, repo: str, state: str = "all", limit: int = 100) -> List[Dict[str, Any]]:
-        """Fetch issues from a repository."""
+        """Fetch issues from a repository as a fully-materialized list."""
         logger.info(f"📥 Fetching issues from {repo} (state={state})")
-        
-        issues = []
-        page = 1
+        issues = list(self.iter_issues(repo, state=state, limit=limit))
+        logger.info(f"✅ Fetched {len(issues)} issues from {repo}")
+        return issues
+
+    def iter_issues(self, repo: str, state: str = "all", limit: int = 100,
+                    use_search: bool = False, since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield issues page by page.
+
+        Peak memory stays at roughly one page, and downstream consumers
+        (transform + POST) overlap with the remaining page fetches.
+
+        With use_search, the search API filters out pull requests
+        server-side (is:issue), skipping their payload entirely. Search
+        has its own 30 requests/min quota, so it is opt-in and best for
+        small fetches; the REST listing remains the default.
+        """
+        if use_search:
+            yield from self._iter_issues_search(repo, state, limit, since)
+            return
+
         per_page = min(limit, 100)
-        
-        while len(issues) < limit:
-            endpoint = f"/repos/{repo}/issues?state={state}&per_page={per_page}&page={page}&sort=updated&direction=asc"
-            
+        since_param = f"&since={since}" if since else ""
+
+        def endpoint_for(page: int) -> str:
+            return (f"/repos/{repo}/issues?state={state}&per_page={per_page}"
+                    f"&page={page}&sort=updated&direction=asc{since_param}")
+
+        try:
+            first = self.client.get(endpoint_for(1))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"❌ Error fetching issues from {repo}: {e}")
+            return
+
+        yielded = 0
+        for issue in first:
+            if yielded >= limit:
+                return
+            yield issue
+            yielded += 1
+
+        if not first or len(first) < per_page or yielded >= limit:
+            return
+
+        last_page = self._last_page(self.client.last_response_headers)
+        if last_page > 1:
+            # Pagination metadata tells us the page count up front, so
+            # fetch the remaining pages concurrently instead of walking
+            # them one blocking round-trip at a time
+            last_page = min(last_page, -(-limit // per_page))
+            endpoints = [endpoint_for(p) for p in range(2, last_page + 1)]
+            workers = min(MAX_CONCURRENT_POSTS, len(endpoints))
             try:
-                data = self.client.get(endpoint)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for data in executor.map(self.client.get, endpoints):
+                        for issue in data:
+                            if yielded >= limit:
+                                return
+                            yield issue
+                            yielded += 1
+            except requests.exceptions.RequestException as e:
+                logger.error(f"❌ Error fetching issues from {repo}: {e}")
+        else:
+            # No Link header available - fall back to serial paging
+            page = 2
+            while yielded < limit:
+                try:
+                    data = self.client.get(endpoint_for(page))
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"❌ Error fetching issues from {repo}: {e}")
+                    break
+
                 if not data:
                     break
-                
-                issues.extend(data)
+
+                for issue in data:
+                    if yielded >= limit:
+                        return
+                    yield issue
+                    yielded += 1
                 page += 1
-                
+
                 if len(data) < per_page:
                     break
+
+    def _iter_issues_search(self, repo: str, state: str, limit: int,
+                            since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield issues from /search/issues, which excludes PRs server-side."""
+        per_page = min(limit, 100)
+        query = f"repo:{repo}+is:issue"
+        if state != "all":
+            query += f"+state:{state}"
+        if since:
+            # Search has no ?since= parameter; the updated qualifier is
+            # its equivalent, keeping incremental sync working here too
+            query += f"+updated:>={since}"
+
+        yielded = 0
+        page = 1
+        while yielded < limit:
+            endpoint = (f"/search/issues?q={query}&per_page={per_page}"
+                        f"&page={page}&sort=updated&order=asc")
+            try:
+                result = self.client.get(endpoint)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"❌ Error searching issues in {repo}: {e}")
+                return
+
+            items = result.get('items', []) if isinstance(result, dict) else []
+            if not items:
+                return
+
+            for issue in items:
+                if yielded >= limit:
+                    return
+                yield issue
+                yielded += 1
+
+            if len(items) < per_page:
+                return
+            page += 1
+
+    @staticmethod
+    def _last_page(headers) -> int:
+        """Parse the last page number from a Link header (0 if unknown)."""
+        if not headers:
+            return 0
+        match = _LINK_LAST_RE.search(headers.get('Link', '') or '')
+        return int(match.group(1)) if match else 0
+
+    def fetch_issues_graphql(self, repo: str, state: str = "all", limit: int = 100) -> List[Dict[str, Any]]:
+        """Fetch issues via the GraphQL API, requesting only consumed fields.
+
+        Returns issues in the same shape as fetch_issues so they can be fed
+        straight into IssueTransformer.transform_issue. Cuts payload bytes
+        roughly 3-5x versus the fully-expanded REST responses.
+        """
+        logger.info(f"📥 Fetching issues from {repo} via GraphQL (state={state})")
+
+        owner, name = repo.split('/')
+        states = {"open": ["OPEN"], "closed": ["CLOSED"]}.get(state)
+        issues = []
+        cursor = None
+
+        while len(issues) < limit:
+            try:
+                data = self.client.graphql(_ISSUES_QUERY, {
+                    'owner': owner,
+                    'name': name,
+                    'pageSize': min(limit - len(issues), 100),
+                    'cursor': cursor,
+                    'states': states,
+                })
             except requests.exceptions.RequestException as e:
                 logger.error(f"❌ Error fetching issues from {repo}: {e}")
                 break
-        
+
+            connection = (data.get('repository') or {}).get('issues') or {}
+            issues.extend(self._node_to_issue(node) for node in connection.get('nodes', []))
+
+            page_info = connection.get('pageInfo', {})
+            if not page_info.get('hasNextPage'):
+                break
+            cursor = page_info.get('endCursor')
+
         logger.info(f"✅ Fetched {len(issues)} issues from {repo}")
         return issues[:limit]
 
+    @staticmethod
+    def _node_to_issue(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL issue node to the REST issue shape."""
+        return {
+            'number': node.get('number'),
+            'title': node.get('title'),
+            'body': node.get('body'),
+            'state': (node.get('state') or 'OPEN').lower(),
+            'html_url': node.get('url'),
+            'created_at': node.get('createdAt'),
+            'user': {'login': (node.get('author') or {}).get('login', 'unknown')},
+            'labels': (node.get('labels') or {}).get('nodes', []),
+            'assignees': (node.get('assignees') or {}).get('nodes', []),
+            'milestone': node.get('milestone'),
+        }
+
+
+# Attribution block appended to every migrated issue body
+_ATTRIBUTION_TEMPLATE = """
+---
+**Migrated from:** [{repo}]({url})
+**Original Author:** @{author}
+**Original Created:** {created}
+"""
+
+# Hidden marker identifying the source issue, so re-runs can detect
+# already-migrated issues with a single search query
+_SRC_MARKER = "<!-- src:{repo}#{number} -->"
+_SRC_MARKER_RE = re.compile(r'<!-- src:(\S+)#(\d+) -->')
+
+# C-level field accessors for the hot label/assignee extraction loops
+_get_name = operator.itemgetter('name')
+_get_login = operator.itemgetter('login')
+
+# Per-repo incremental-sync cursors live here; each file records the
+# max updated_at seen, fed back as ?since= on the next run
+_STATE_DIR = Path('.migrate_state')
+
+
+def _sync_state_path(source_repo: str) -> Path:
+    return _STATE_DIR / f"{source_repo.replace('/', '_')}.json"
+
+
+def _load_sync_cursor(source_repo: str) -> Optional[str]:
+    """Read the last-synced updated_at timestamp for a source repo."""
+    try:
+        with open(_sync_state_path(source_repo), 'r', encoding='utf-8') as f:
+            return json.load(f).get('last_updated')
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _save_sync_cursor(source_repo: str, last_updated: str) -> None:
+    """Persist the max updated_at timestamp for the next incremental run."""
+    path = _sync_state_path(source_repo)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'last_updated': last_updated}, f)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not save sync cursor for {source_repo}: {e}")
+
 
 class IssueTransformer:
     """Transforms issues with source repository attribution."""
-    
+
     @staticmethod
     def transform_issue(issue: Dict[str, Any], source_repo: str) -> Dict[str, str]:
         """Transform an issue with source attribution."""
-        
-        # Build the issue body with source attribution
-        original_body = issue.get('body', '') or ''
-        original_url = issue.get('html_url', '')
-        original_author = issue.get('user', {}).get('login', 'unknown')
-        created_at = issue.get('created_at', '')
-        
-        attribution = f"""
----
-**Migrated from:** [{source_repo}]({original_url})
-**Original Author:** @{original_author}
-**Original Created:** {created_at}
-"""
-        
-        new_body = f"{original_body}\n{attribution}"
-        
-        # Extract labels (excluding pull_request label)
-        labels = [label['name'] for label in issue.get('labels', []) 
-                 if label['name'] != 'pull_request']
-        
-        # Add source repo label
-        labels.append(f"migrated-from-{source_repo.split('/')[-1]}")
-        
-        return {
-            'title': issue.get('title', 'Untitled'),
-            'body': new_body,
-            'labels': labels,
-            'state': issue.get('state', 'open'),
-            'assignees': [assignee['login'] for assignee in issue.get('assignees', [])],
-            'milestone': issue.get('milestone', {}).get('title') if issue.get('milestone') else None,
-            'original_number': issue.get('number'),
-            'original_repo': source_repo,
-            'original_url': original_url,
-        }
+        return IssueTransformer.transform_issues_batch([issue], source_repo)[0]
+
+    @staticmethod
+    def transform_issues_batch(issues: List[Dict[str, Any]], source_repo: str) -> List[Dict[str, Any]]:
+        """Transform a batch of issues with source attribution.
+
+        Per-repo invariants (the migrated-from label and the attribution
+        template) are computed once for the whole batch instead of per issue.
+        """
+        migrated_label = f"migrated-from-{source_repo.split('/')[-1]}"
+        attribution_format = _ATTRIBUTION_TEMPLATE.format
+        marker_format = _SRC_MARKER.format
+
+        transformed = []
+        append = transformed.append
+        for issue in issues:
+            get = issue.get
+            original_body = get('body', '') or ''
+            original_url = get('html_url', '')
+
+            user = get('user')
+            attribution = attribution_format(
+                repo=source_repo,
+                url=original_url,
+                author=user.get('login', 'unknown') if user else 'unknown',
+                created=get('created_at', '')
+            )
+
+            # Extract labels (excluding pull_request label); itemgetter
+            # under map does one dict lookup per label, at C speed
+            labels = [name for name in map(_get_name, get('labels') or ())
+                      if name != 'pull_request']
+            labels.append(migrated_label)
+
+            milestone = get('milestone')
+            marker = marker_format(repo=source_repo, number=get('number'))
+            append({
+                'title': get('title', 'Untitled'),
+                'body': f"{original_body}\n{attribution}{marker}",
+                'labels': labels,
+                'state': get('state', 'open'),
+                'assignees': list(map(_get_login, get('assignees') or ())),
+                'milestone': milestone.get('title') if milestone else None,
+                'original_number': get('number'),
+                'original_repo': source_repo,
+                'original_url': original_url,
+            })
+
+        return transformed
 
 
 class IssueMigrator:
@@ -163,7 +578,13 @@ class IssueMigrator:
         self.client = client
         self.migrated_count = 0
         self.failed_count = 0
-        self.migration_log = []
+        # deque appends never trigger the occasional O(n) reallocation
+        # list.append pays while the log grows
+        self.migration_log = deque()
+        # Counters and log are shared across concurrent migrations
+        self._lock = threading.Lock()
+        # Cheap epoch-ns sample; formatted only when a summary is built
+        self._started_ns = time.time_ns()
     
     def migrate_issue(self, target_repo: str, transformed_issue: Dict[str, Any], dry_run: bool = False) -> bool:
         """Migrate a single issue to target repository."""
@@ -193,89 +614,172 @@ class IssueMigrator:
             # Create the issue
             endpoint = f"/repos/{target_repo}/issues"
             result = self.client.post(endpoint, issue_data)
-            
-            self.migrated_count += 1
+
             new_issue_number = result.get('number')
-            
+
             logger.info(f"✅ Migrated {transformed_issue['original_repo']}#{transformed_issue['original_number']} → {target_repo}#{new_issue_number}")
-            
-            self.migration_log.append({
-                'status': 'success',
-                'title': transformed_issue['title'],
-                'original_repo': transformed_issue['original_repo'],
-                'original_number': transformed_issue['original_number'],
-                'new_number': new_issue_number,
-                'new_url': result.get('html_url'),
-            })
-            
+
+            with self._lock:
+                self.migrated_count += 1
+                self.migration_log.append({
+                    'status': 'success',
+                    'title': transformed_issue['title'],
+                    'original_repo': transformed_issue['original_repo'],
+                    'original_number': transformed_issue['original_number'],
+                    'new_number': new_issue_number,
+                    'new_url': result.get('html_url'),
+                })
+
             return True
-        
+
         except requests.exceptions.RequestException as e:
-            self.failed_count += 1
             logger.error(f"❌ Failed to migrate {transformed_issue['original_repo']}#{transformed_issue['original_number']}: {e}")
-            
-            self.migration_log.append({
-                'status': 'failed',
-                'title': transformed_issue['title'],
-                'original_repo': transformed_issue['original_repo'],
-                'original_number': transformed_issue['original_number'],
-                'error': str(e),
-            })
-            
+
+            with self._lock:
+                self.failed_count += 1
+                self.migration_log.append({
+                    'status': 'failed',
+                    'title': transformed_issue['title'],
+                    'original_repo': transformed_issue['original_repo'],
+                    'original_number': transformed_issue['original_number'],
+                    'error': str(e),
+                })
+
             return False
-    
+
+    def fetch_migrated_keys(self, target_repo: str, source_repo: str) -> set:
+        """Return (repo, number) keys of issues already migrated to the target.
+
+        Search queries over the source markers embedded in migrated bodies
+        replace a per-issue existence check against the target repo. The
+        search API caps result sets at 1000 (10 pages of 100); beyond that
+        the key set is incomplete and the cap is logged.
+        """
+        base = (f"/search/issues?q=repo:{target_repo}+is:issue+"
+                f"%22src:{source_repo}%22+in:body&per_page=100")
+        keys = set()
+        total_count = 0
+        for page in range(1, 11):
+            try:
+                result = self.client.get(f"{base}&page={page}")
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"⚠️ Could not check for existing migrations "
+                               f"(page {page}): {e}; dedup set may be incomplete")
+                return keys
+
+            if not isinstance(result, dict):
+                return keys
+            total_count = result.get('total_count', total_count)
+            items = result.get('items', [])
+            for item in items:
+                for repo, number in _SRC_MARKER_RE.findall(item.get('body') or ''):
+                    keys.add((repo, int(number)))
+
+            if len(items) < 100:
+                return keys
+
+        if total_count > 1000:
+            logger.warning(f"⚠️ {total_count} migrated issues in {target_repo} exceed "
+                           f"the search API's 1000-result cap; dedup set is incomplete")
+        return keys
+
     def get_summary(self) -> Dict[str, Any]:
         """Get migration summary."""
+        finished_ns = time.time_ns()
         return {
             'migrated': self.migrated_count,
             'failed': self.failed_count,
             'total': self.migrated_count + self.failed_count,
-            'timestamp': datetime.now().isoformat(),
-            'log': self.migration_log,
+            'started_at_ns': self._started_ns,
+            'finished_at_ns': finished_ns,
+            'timestamp': datetime.fromtimestamp(finished_ns / 1_000_000_000).isoformat(),
+            'log': list(self.migration_log),
         }
 
 
-def migrate_issues(source_repo: str, target_repo: str, token: str, dry_run: bool = False, limit: int = 100) -> Dict[str, Any]:
+def migrate_issues(source_repo: str, target_repo: str, token: str, dry_run: bool = False,
+                   limit: int = 100, client: Optional[GitHubAPIClient] = None,
+                   use_search: bool = False) -> Dict[str, Any]:
     """
     Migrate issues from source repository to target repository.
-    
+
     Args:
         source_repo: Source repository in format 'owner/repo'
         target_repo: Target repository in format 'owner/repo'
         token: GitHub API token
         dry_run: If True, don't actually create issues
         limit: Maximum number of issues to migrate
-    
+        client: Existing API client to reuse; batch callers share one
+            client so its connection pool and caches span repositories
+        use_search: Fetch via the search API so pull requests are
+            filtered server-side instead of downloaded then skipped
+
     Returns:
         Migration summary with results
     """
-    
+
     logger.info(f"🚀 Starting issue migration from {source_repo} to {target_repo}")
-    
-    client = GitHubAPIClient(token)
+
+    if client is None:
+        client = GitHubAPIClient(token)
     extractor = IssueExtractor(client)
     migrator = IssueMigrator(client)
     
-    # Fetch issues from source
-    issues = extractor.fetch_issues(source_repo, state="all", limit=limit)
-    
-    if not issues:
+    # Stream issues from source: transform/POST overlap with page fetches
+    # and peak memory stays at about one page of issues
+    total_seen = 0
+
+    # Incremental sync: source pages are sorted by updated_at ascending,
+    # so the last issue seen is the cursor for the next run's ?since=
+    since = None if dry_run else _load_sync_cursor(source_repo)
+    if since:
+        logger.info(f"⏩ Incremental sync: only issues updated since {since}")
+    last_updated = None
+
+    if dry_run:
+        for issue in extractor.iter_issues(source_repo, state="all", limit=limit,
+                                           use_search=use_search):
+            total_seen += 1
+            if issue.get('pull_request'):
+                logger.info(f"⏭️ Skipping PR: {issue.get('title')}")
+                continue
+            transformed = IssueTransformer.transform_issue(issue, source_repo)
+            migrator.migrate_issue(target_repo, transformed, dry_run=True)
+    else:
+        # One search query up front finds issues migrated by earlier runs,
+        # so re-runs skip them instead of creating duplicates
+        already_migrated = migrator.fetch_migrated_keys(target_repo, source_repo)
+
+        # Issue creation is network-bound: each POST waits a full round
+        # trip, so overlap them with a bounded worker pool
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_POSTS) as executor:
+            futures = []
+            for issue in extractor.iter_issues(source_repo, state="all", limit=limit,
+                                               use_search=use_search, since=since):
+                total_seen += 1
+                last_updated = issue.get('updated_at') or last_updated
+                if issue.get('pull_request'):
+                    logger.info(f"⏭️ Skipping PR: {issue.get('title')}")
+                    continue
+                if (source_repo, issue.get('number')) in already_migrated:
+                    logger.info(f"⏭️ Skipping already-migrated issue: {source_repo}#{issue.get('number')}")
+                    continue
+                transformed = IssueTransformer.transform_issue(issue, source_repo)
+                futures.append(executor.submit(migrator.migrate_issue, target_repo, transformed))
+            for future in futures:
+                future.result()
+
+    if total_seen == 0:
         logger.warning(f"⚠️ No issues found in {source_repo}")
         return migrator.get_summary()
-    
-    # Migrate each issue
-    for issue in issues:
-        # Skip pull requests
-        if issue.get('pull_request'):
-            logger.info(f"⏭️ Skipping PR: {issue.get('title')}")
-            continue
-        
-        # Transform and migrate
-        transformed = IssueTransformer.transform_issue(issue, source_repo)
-        migrator.migrate_issue(target_repo, transformed, dry_run=dry_run)
-    
+
     summary = migrator.get_summary()
     logger.info(f"✅ Migration complete: {summary['migrated']} migrated, {summary['failed']} failed")
-    
+
+    # Only advance the cursor on a clean run; a failed issue would
+    # otherwise be skipped forever by the next incremental fetch
+    if not dry_run and last_updated and summary['failed'] == 0:
+        _save_sync_cursor(source_repo, last_updated)
+
     return summary
 
@@ -10,12 +10,21 @@ This module provides functionality to:
 - Generate markdown reports with insights
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
-import statistics
-import math
 from enum import Enum
+import io
+
+import numpy as np
+
+from _kernels import column_stats
+
+# pandas is optional: only the DataFrame ingestion path needs it
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 
 class AnomalySeverity(Enum):
@@ -34,7 +43,7 @@ class RecommendationPriority(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trend:
     """Data structure for trend analysis."""
     metric_name: str
@@ -44,8 +53,19 @@ class Trend:
     inflection_points: List[int] = field(default_factory=list)
     forecast_value: Optional[float] = None
 
+    def to_dict(self) -> Dict:
+        """Plain-dict view without asdict's recursive deepcopy."""
+        return {
+            "metric_name": self.metric_name,
+            "direction": self.direction,
+            "slope": self.slope,
+            "confidence": self.confidence,
+            "inflection_points": self.inflection_points,
+            "forecast_value": self.forecast_value,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Anomaly:
     """Data structure for detected anomalies."""
     metric_name: str
@@ -56,9 +76,26 @@ class Anomaly:
     anomaly_type: str  # "statistical", "behavioral", "seasonal"
     description: str
     deviation_percent: float
+    # Integer mirror of severity (0=low..3=critical): plain int compares
+    # skip the Enum dunder dispatch in the filtering hot paths
+    severity_code: int = 0
+
+    def to_dict(self) -> Dict:
+        """Plain-dict view; severity is flattened to its string value."""
+        return {
+            "metric_name": self.metric_name,
+            "timestamp": self.timestamp,
+            "value": self.value,
+            "expected_value": self.expected_value,
+            "severity": self.severity.value,
+            "anomaly_type": self.anomaly_type,
+            "description": self.description,
+            "deviation_percent": self.deviation_percent,
+            "severity_code": self.severity_code,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Correlation:
     """Data structure for metric correlations."""
     metric1: str
@@ -67,8 +104,18 @@ class Correlation:
     is_leading_indicator: bool
     description: str
 
+    def to_dict(self) -> Dict:
+        """Plain-dict view without asdict's recursive deepcopy."""
+        return {
+            "metric1": self.metric1,
+            "metric2": self.metric2,
+            "correlation_coefficient": self.correlation_coefficient,
+            "is_leading_indicator": self.is_leading_indicator,
+            "description": self.description,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     """Data structure for actionable recommendations."""
     id: str
@@ -83,7 +130,7 @@ class Recommendation:
     action_items: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Insight:
     """Data structure for insights."""
     category: str  # "health", "performance", "quality", "bottleneck"
@@ -92,6 +139,41 @@ class Insight:
     metrics_involved: List[str] = field(default_factory=list)
     severity: str = "info"  # "info", "warning", "critical"
 
+    def to_dict(self) -> Dict:
+        """Plain-dict view without asdict's recursive deepcopy."""
+        return {
+            "category": self.category,
+            "title": self.title,
+            "description": self.description,
+            "metrics_involved": self.metrics_involved,
+            "severity": self.severity,
+        }
+
+
+def _ingest_rows(entries: List[Dict], names: List[str]) -> np.ndarray:
+    """Convert history entries to a float block; non-numeric cells become NaN.
+
+    A nested comprehension handed straight to np.array keeps the per-cell
+    work to one dict lookup and one isinstance check, with the array
+    construction itself running in C.
+    """
+    nan = float("nan")
+    numeric = (int, float)
+    return np.array(
+        [[v if isinstance(v := entry.get(name), numeric) else nan for name in names]
+         for entry in entries],
+        dtype=np.float64
+    )
+
+
+# Severity by threshold index: z < 2.5, >= 2.5, > 3, > 4
+_SEVERITY_LEVELS = np.array([
+    AnomalySeverity.LOW,
+    AnomalySeverity.MEDIUM,
+    AnomalySeverity.HIGH,
+    AnomalySeverity.CRITICAL,
+], dtype=object)
+
 
 class LearningAnalyzer:
     """Analyzer for detecting patterns and generating insights from metrics history."""
@@ -104,12 +186,70 @@ class LearningAnalyzer:
             metrics_history: List of metrics dictionaries with timestamp and metric values
         """
         self.metrics_history = metrics_history
+        # Column-major view of the history, built lazily on first analysis
+        self._matrix: Optional[np.ndarray] = None
+        self._present: Optional[np.ndarray] = None
+        self._metric_names: List[str] = []
+        self._timestamps: List[Any] = []
+        # Memoized analyze_patterns result, valid while no rows arrive
+        self._analysis_cache: Optional[Dict] = None
+        self._analyzed_rows = -1
         self.trends: List[Trend] = []
         self.anomalies: List[Anomaly] = []
         self.correlations: List[Correlation] = []
         self.insights: List[Insight] = []
         self.recommendations: List[Recommendation] = []
 
+    @classmethod
+    def from_matrix(cls, matrix: Any, metric_names: List[str],
+                    timestamps: Optional[List[Any]] = None) -> "LearningAnalyzer":
+        """
+        Build an analyzer directly from a (snapshots x metrics) array.
+
+        Skips the dict-per-snapshot conversion entirely: callers that
+        already hold tabular data hand over one contiguous float block.
+
+        Args:
+            matrix: 2D array-like of metric values, one row per snapshot
+            metric_names: Column names, parallel to the matrix columns
+            timestamps: Optional per-row timestamps
+
+        Returns:
+            LearningAnalyzer backed by the given matrix
+        """
+        analyzer = cls([])
+        analyzer._matrix = np.asarray(matrix, dtype=np.float64)
+        analyzer._present = ~np.isnan(analyzer._matrix)
+        analyzer._metric_names = list(metric_names)
+        if timestamps is not None:
+            analyzer._timestamps = list(timestamps)
+        else:
+            analyzer._timestamps = [datetime.now()] * analyzer._matrix.shape[0]
+        return analyzer
+
+    @classmethod
+    def from_dataframe(cls, df: "pd.DataFrame") -> "LearningAnalyzer":
+        """
+        Build an analyzer from a pandas DataFrame (one row per snapshot,
+        one numeric column per metric). Requires pandas.
+        """
+        if pd is None:
+            raise ImportError("pandas is required for LearningAnalyzer.from_dataframe")
+        numeric = df.select_dtypes('number')
+        return cls.from_matrix(
+            numeric.to_numpy(dtype=np.float64, copy=False),
+            numeric.columns.tolist(),
+            list(df.index)
+        )
+
+    @property
+    def _n_snapshots(self) -> int:
+        """Number of snapshots, whichever input path was used."""
+        if self._matrix is not None:
+            # The history may have grown since the matrix was last built
+            return max(self._matrix.shape[0], len(self.metrics_history))
+        return len(self.metrics_history)
+
     def analyze_patterns(self) -> Dict:
         """
         Analyze patterns in metrics over time.
@@ -117,7 +257,8 @@ class LearningAnalyzer:
         Returns:
             Dictionary with trends, anomalies, correlations, and insights
         """
-        if not self.metrics_history:
+        n_rows = self._n_snapshots
+        if n_rows == 0:
             return {
                 "trends": [],
                 "anomalies": [],
@@ -125,6 +266,11 @@ class LearningAnalyzer:
                 "insights": []
             }
 
+        # Polling callers re-invoke this on a fixed cadence; skip the
+        # whole recompute while no new snapshots have arrived
+        if self._analysis_cache is not None and n_rows == self._analyzed_rows:
+            return self._analysis_cache
+
         # Analyze trends for each metric
         self.trends = self._analyze_trends()
         
@@ -137,31 +283,163 @@ class LearningAnalyzer:
         # Generate insights
         self.insights = self._generate_insights()
 
+        result = {
+            "trends": [t.to_dict() for t in self.trends],
+            "anomalies": [a.to_dict() for a in self.anomalies],
+            "correlations": [c.to_dict() for c in self.correlations],
+            "insights": [i.to_dict() for i in self.insights]
+        }
+        self._analysis_cache = result
+        self._analyzed_rows = n_rows
+        return result
+
+    def analyze_patterns_rolling(self, window: int, lag: int = 0) -> Dict:
+        """
+        Analyze anomalies and correlations over a sliding window.
+
+        Rolling mean/stdev per metric come from cumulative sums (the
+        E[x^2] - E[x]^2 identity), so every window position is covered in
+        one pass over the history instead of recomputing the full series
+        each time new data arrives. Correlations are computed over the
+        most recent window only, optionally lagging the second metric to
+        surface leading indicators.
+
+        Args:
+            window: Number of trailing snapshots per window
+            lag: Shift applied to the second metric of each correlation
+                pair (positive means metric2 lags metric1)
+
+        Returns:
+            Dictionary with rolling anomalies and latest-window correlations
+        """
+        if self._n_snapshots == 0:
+            return {"anomalies": [], "correlations": []}
+
+        self._build_matrix()
+        matrix = self._matrix
+        n_rows = matrix.shape[0]
+        window = max(2, min(window, n_rows))
+
+        present = self._present
+        filled = np.where(present, matrix, 0.0)
+
+        # Trailing-window sums via cumsum differences: O(n) total
+        def trailing(cumulative: np.ndarray) -> np.ndarray:
+            out = cumulative.copy()
+            out[window:] = cumulative[window:] - cumulative[:-window]
+            return out
+
+        sums = trailing(np.cumsum(filled, axis=0))
+        squares = trailing(np.cumsum(filled * filled, axis=0))
+        counts = trailing(np.cumsum(present, axis=0))
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+            variances = np.maximum(squares / counts - means * means, 0.0)
+            stdevs = np.sqrt(variances * (counts / np.maximum(counts - 1, 1)))
+            z_scores = (matrix - means) / stdevs
+
+        valid = present & (counts >= 3) & (stdevs > 0)
+
+        anomalies = []
+        for i, j in np.argwhere(valid & (np.abs(z_scores) > 1.5)):
+            value = float(matrix[i, j])
+            mean = float(means[i, j])
+            z_abs = abs(float(z_scores[i, j]))
+            code = int(z_abs >= 2.5) + (z_abs > 3) + (z_abs > 4)
+            anomalies.append(Anomaly(
+                metric_name=self._metric_names[j],
+                timestamp=self._timestamps[i],
+                value=value,
+                expected_value=mean,
+                severity=_SEVERITY_LEVELS[code],
+                anomaly_type="statistical",
+                description=f"Value {value} deviates from rolling mean {mean:.2f}",
+                deviation_percent=((value - mean) / mean * 100) if mean != 0 else 0,
+                severity_code=code
+            ))
+
+        # Correlations over the latest window, with optional lag
+        correlations = []
+        tail = matrix[-window:]
+        names = self._metric_names
+        for i in range(len(names)):
+            for k in range(i + 1, len(names)):
+                a = tail[:, i]
+                b = tail[:, k]
+                if lag > 0:
+                    a, b = a[:-lag], b[lag:]
+                both = ~np.isnan(a) & ~np.isnan(b)
+                if both.sum() >= 2:
+                    corr = self.calculate_correlation(a[both], b[both])
+                    if abs(corr) > 0.5:
+                        correlations.append(Correlation(
+                            metric1=names[i],
+                            metric2=names[k],
+                            correlation_coefficient=corr,
+                            is_leading_indicator=corr > 0.7,
+                            description=f"Rolling correlation between {names[i]} and {names[k]}"
+                            + (f" (lag {lag})" if lag else "")
+                        ))
+
         return {
-            "trends": [asdict(t) for t in self.trends],
-            "anomalies": [asdict(a) for a in self.anomalies],
-            "correlations": [asdict(c) for c in self.correlations],
-            "insights": [asdict(i) for i in self.insights]
+            "anomalies": [a.to_dict() for a in anomalies],
+            "correlations": [c.to_dict() for c in correlations]
         }
 
+    def _build_matrix(self) -> None:
+        """Convert the dict-per-snapshot history into one float matrix.
+
+        A single pass fills a (snapshots x metrics) array with NaN for
+        missing values; trends, anomalies, and correlations then read
+        contiguous columns instead of each re-walking the dicts with
+        their own membership and isinstance checks.
+
+        Rebuilds are incremental: when the history has grown since the
+        last build, only the new rows are ingested and appended.
+        """
+        history = self.metrics_history
+
+        if self._matrix is not None:
+            new_entries = history[len(self._timestamps):]
+            if not new_entries:
+                return
+
+            now = datetime.now()
+            self._timestamps.extend(entry.get("timestamp", now) for entry in new_entries)
+
+            block = _ingest_rows(new_entries, self._metric_names)
+            self._matrix = np.vstack((self._matrix, block))
+            self._present = np.vstack((self._present, ~np.isnan(block)))
+            return
+
+        first = history[0]
+        names = [k for k in first.keys()
+                 if k != "timestamp" and isinstance(first[k], (int, float))]
+
+        now = datetime.now()
+        timestamps = [entry.get("timestamp", now) for entry in history]
+        matrix = _ingest_rows(history, names)
+
+        self._matrix = matrix
+        # Validity mask shared by every pass, so isnan runs once
+        self._present = ~np.isnan(matrix)
+        self._metric_names = names
+        self._timestamps = timestamps
+
     def _analyze_trends(self) -> List[Trend]:
         """Analyze trends for each metric in the history."""
         trends = []
-        
-        if not self.metrics_history or len(self.metrics_history) < 2:
+
+        if self._n_snapshots < 2:
             return trends
 
-        # Get all metric names from first entry
-        metric_names = [k for k in self.metrics_history[0].keys() 
-                       if k != "timestamp" and isinstance(self.metrics_history[0][k], (int, float))]
+        self._build_matrix()
 
-        for metric_name in metric_names:
-            values = []
-            for entry in self.metrics_history:
-                if metric_name in entry and isinstance(entry[metric_name], (int, float)):
-                    values.append(entry[metric_name])
+        for j, metric_name in enumerate(self._metric_names):
+            values = self._matrix[self._present[:, j], j]
 
-            if len(values) >= 2:
+            if values.size >= 2:
                 trend = self.calculate_trend(values)
                 trend.metric_name = metric_name
                 trends.append(trend)
@@ -186,16 +464,16 @@ class LearningAnalyzer:
                 confidence=0.0
             )
 
-        # Calculate slope using linear regression
-        n = len(values)
+        # Calculate slope using linear regression. With x = 0..n-1 the
+        # denominator sum((i - x_mean)^2) has the closed form n(n^2-1)/12,
+        # so one dot product replaces both Python generator sums.
+        y = np.asarray(values, dtype=np.float64)
+        n = y.size
         x_mean = (n - 1) / 2
-        y_mean = statistics.mean(values)
-        
-        numerator = sum((i - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
-        
-        slope = numerator / denominator if denominator != 0 else 0
-        
+        denominator = n * (n * n - 1) / 12.0
+
+        slope = float((np.arange(n) @ y - n * x_mean * y.mean()) / denominator)
+
         # Determine direction
         if slope > 0.01:
             direction = "increasing"
@@ -205,7 +483,7 @@ class LearningAnalyzer:
             direction = "stable"
 
         # Calculate confidence based on variance
-        variance = statistics.variance(values) if len(values) > 1 else 0
+        variance = float(y.var(ddof=1))
         confidence = min(1.0, abs(slope) / (variance + 1))
 
         return Trend(
@@ -219,41 +497,46 @@ class LearningAnalyzer:
         """Detect anomalies in metrics using statistical methods."""
         anomalies = []
 
-        if not self.metrics_history or len(self.metrics_history) < 3:
+        if self._n_snapshots < 3:
             return anomalies
 
-        metric_names = [k for k in self.metrics_history[0].keys()
-                       if k != "timestamp" and isinstance(self.metrics_history[0][k], (int, float))]
-
-        for metric_name in metric_names:
-            values = []
-            timestamps = []
-
-            for entry in self.metrics_history:
-                if metric_name in entry and isinstance(entry[metric_name], (int, float)):
-                    values.append(entry[metric_name])
-                    timestamps.append(entry.get("timestamp", datetime.now()))
-
-            if len(values) >= 3:
-                # Use z-score method for statistical anomalies
-                mean = statistics.mean(values)
-                stdev = statistics.stdev(values) if len(values) > 1 else 0
-
-                if stdev > 0:
-                    for i, value in enumerate(values):
-                        z_score = abs((value - mean) / stdev)
-                        if z_score > 1.5:  # Threshold for anomaly (lowered from 2.0)
-                            deviation_percent = ((value - mean) / mean * 100) if mean != 0 else 0
-                            anomalies.append(Anomaly(
-                                metric_name=metric_name,
-                                timestamp=timestamps[i],
-                                value=value,
-                                expected_value=mean,
-                                severity=self._calculate_severity(z_score),
-                                anomaly_type="statistical",
-                                description=f"Value {value} deviates significantly from mean {mean:.2f}",
-                                deviation_percent=deviation_percent
-                            ))
+        self._build_matrix()
+        matrix = self._matrix
+
+        # Column-wise mean/stdev/count in one NaN-safe pass; the kernel
+        # is a parallel Welford loop when numba is installed, NumPy
+        # broadcasting otherwise
+        means, stdevs, counts = column_stats(matrix)
+
+        # All z-scores in one broadcast; NaN cells compare False below
+        z_scores = np.abs((matrix - means) / np.where(stdevs > 0, stdevs, 1.0))
+
+        # Branchless severity classification: counting threshold
+        # crossings maps every z-score to its severity index at once,
+        # replacing the per-anomaly if/elif chain
+        severity_idx = (z_scores >= 2.5).astype(np.intp) + (z_scores > 3) + (z_scores > 4)
+
+        # Use z-score method for statistical anomalies; only the handful
+        # of flagged cells are touched in Python
+        for j in np.nonzero((counts >= 3) & (stdevs > 0))[0]:
+            metric_name = self._metric_names[j]
+            mean = float(means[j])
+            # Threshold for anomaly (lowered from 2.0)
+            for i in np.nonzero(z_scores[:, j] > 1.5)[0]:
+                value = float(matrix[i, j])
+                code = int(severity_idx[i, j])
+                deviation_percent = ((value - mean) / mean * 100) if mean != 0 else 0
+                anomalies.append(Anomaly(
+                    metric_name=metric_name,
+                    timestamp=self._timestamps[i],
+                    value=value,
+                    expected_value=mean,
+                    severity=_SEVERITY_LEVELS[code],
+                    anomaly_type="statistical",
+                    description=f"Value {value} deviates significantly from mean {mean:.2f}",
+                    deviation_percent=deviation_percent,
+                    severity_code=code
+                ))
 
         return anomalies
 
@@ -272,27 +555,55 @@ class LearningAnalyzer:
         """Calculate correlations between metrics."""
         correlations = []
         
-        if not self.metrics_history or len(self.metrics_history) < 2:
+        if self._n_snapshots < 2:
+            return correlations
+
+        self._build_matrix()
+        metric_names = self._metric_names
+        matrix = self._matrix
+
+        if len(metric_names) < 2:
+            return correlations
+
+        # Constant columns can never correlate (zero denominator), so
+        # drop them before any pairwise work instead of rediscovering
+        # that per pair
+        _, stdevs, _ = column_stats(matrix)
+        active = np.nonzero(stdevs > 0)[0]
+        if active.size < 2:
             return correlations
 
-        metric_names = [k for k in self.metrics_history[0].keys() 
-                       if k != "timestamp" and isinstance(self.metrics_history[0][k], (int, float))]
-
-        # Calculate correlations between all metric pairs
-        for i, metric1 in enumerate(metric_names):
-            for metric2 in metric_names[i+1:]:
-                values1 = []
-                values2 = []
-                
-                for entry in self.metrics_history:
-                    if (metric1 in entry and metric2 in entry and 
-                        isinstance(entry[metric1], (int, float)) and 
-                        isinstance(entry[metric2], (int, float))):
-                        values1.append(entry[metric1])
-                        values2.append(entry[metric2])
-
-                if len(values1) >= 2:
-                    corr = self.calculate_correlation(values1, values2)
+        if self._present.all():
+            # Complete matrix: one BLAS-backed corrcoef call yields every
+            # pairwise coefficient at once
+            coefficients = np.corrcoef(matrix[:, active], rowvar=False)
+
+            significant = np.abs(coefficients) > 0.5
+            significant &= np.triu(np.ones_like(significant), k=1)
+
+            for i, k in zip(*np.nonzero(significant)):
+                metric1 = metric_names[active[i]]
+                metric2 = metric_names[active[k]]
+                corr = float(coefficients[i, k])
+                correlations.append(Correlation(
+                    metric1=metric1,
+                    metric2=metric2,
+                    correlation_coefficient=corr,
+                    is_leading_indicator=corr > 0.7,
+                    description=f"Strong correlation between {metric1} and {metric2}"
+                ))
+            return correlations
+
+        # Missing values: fall back to per-pair masking
+        for a in range(active.size):
+            i = active[a]
+            metric1 = metric_names[i]
+            for k in active[a + 1:]:
+                metric2 = metric_names[k]
+                both = self._present[:, i] & self._present[:, k]
+
+                if both.sum() >= 2:
+                    corr = self.calculate_correlation(matrix[both, i], matrix[both, k])
                     if abs(corr) > 0.5:  # Only include significant correlations
                         correlations.append(Correlation(
                             metric1=metric1,
@@ -318,19 +629,14 @@ class LearningAnalyzer:
         if len(metric1) < 2 or len(metric2) < 2 or len(metric1) != len(metric2):
             return 0.0
 
-        mean1 = statistics.mean(metric1)
-        mean2 = statistics.mean(metric2)
-        
-        numerator = sum((metric1[i] - mean1) * (metric2[i] - mean2) for i in range(len(metric1)))
-        
-        var1 = sum((x - mean1) ** 2 for x in metric1)
-        var2 = sum((x - mean2) ** 2 for x in metric2)
-        denominator = math.sqrt(var1 * var2)
-        
-        if denominator == 0:
+        a = np.asarray(metric1, dtype=np.float64)
+        b = np.asarray(metric2, dtype=np.float64)
+
+        # Constant series have no defined correlation
+        if a.std() == 0 or b.std() == 0:
             return 0.0
-        
-        return numerator / denominator
+
+        return float(np.corrcoef(a, b)[0, 1])
 
     def _generate_insights(self) -> List[Insight]:
         """Generate insights from trends and anomalies."""
@@ -349,24 +655,31 @@ class LearningAnalyzer:
                     severity="info"
                 ))
 
-        # Anomaly insights - check for any anomalies, not just critical
+        # Anomaly insights - check for any anomalies, not just critical;
+        # one pass buckets by severity code and collects the metric names
         if self.anomalies:
-            critical_anomalies = [a for a in self.anomalies if a.severity == AnomalySeverity.CRITICAL]
-            high_anomalies = [a for a in self.anomalies if a.severity == AnomalySeverity.HIGH]
-
-            if critical_anomalies:
+            n_anomalies = len(self.anomalies)
+            critical_metrics = []
+            has_high = False
+            for a in self.anomalies:
+                if a.severity_code == 3:
+                    critical_metrics.append(a.metric_name)
+                elif a.severity_code == 2:
+                    has_high = True
+
+            if critical_metrics:
                 insights.append(Insight(
                     category="bottleneck",
                     title="Critical Anomalies Detected",
-                    description=f"Found {len(critical_anomalies)} critical anomalies requiring attention",
-                    metrics_involved=[a.metric_name for a in critical_anomalies],
+                    description=f"Found {len(critical_metrics)} critical anomalies requiring attention",
+                    metrics_involved=critical_metrics,
                     severity="critical"
                 ))
-            elif high_anomalies or len(self.anomalies) > 2:
+            elif has_high or n_anomalies > 2:
                 insights.append(Insight(
                     category="bottleneck",
                     title="Anomalies Detected",
-                    description=f"Found {len(self.anomalies)} anomalies in metrics",
+                    description=f"Found {n_anomalies} anomalies in metrics",
                     metrics_involved=[a.metric_name for a in self.anomalies],
                     severity="warning"
                 ))
@@ -451,44 +764,48 @@ class LearningAnalyzer:
         Returns:
             Markdown formatted report
         """
-        report = []
-        report.append("# Continuous Learning Report\n")
-        report.append(f"**Organization**: {adf.get('architecture', {}).get('name', 'Unknown')}\n")
-        report.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        org = adf.get('architecture', {}).get('name', 'Unknown')
+
+        buf = io.StringIO()
+        write = buf.write
+
+        write(f"# Continuous Learning Report\n"
+              f"**Organization**: {org}\n"
+              f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
         # Executive Summary
-        report.append("## Executive Summary\n")
-        report.append(f"- Total Trends Analyzed: {len(self.trends)}\n")
-        report.append(f"- Anomalies Detected: {len(self.anomalies)}\n")
-        report.append(f"- Correlations Found: {len(self.correlations)}\n")
-        report.append(f"- Insights Generated: {len(self.insights)}\n\n")
+        write(f"## Executive Summary\n"
+              f"- Total Trends Analyzed: {len(self.trends)}\n"
+              f"- Anomalies Detected: {len(self.anomalies)}\n"
+              f"- Correlations Found: {len(self.correlations)}\n"
+              f"- Insights Generated: {len(self.insights)}\n\n")
 
         # Trends Section
         if self.trends:
-            report.append("## Trends\n")
+            write("## Trends\n")
             for trend in self.trends:
-                report.append(f"### {trend.metric_name}\n")
-                report.append(f"- Direction: {trend.direction}\n")
-                report.append(f"- Slope: {trend.slope:.4f}\n")
-                report.append(f"- Confidence: {trend.confidence:.2%}\n\n")
+                write(f"### {trend.metric_name}\n"
+                      f"- Direction: {trend.direction}\n"
+                      f"- Slope: {trend.slope:.4f}\n"
+                      f"- Confidence: {trend.confidence:.2%}\n\n")
 
         # Anomalies Section
         if self.anomalies:
-            report.append("## Anomalies Detected\n")
+            write("## Anomalies Detected\n")
             for anomaly in self.anomalies:
-                report.append(f"### {anomaly.metric_name}\n")
-                report.append(f"- Severity: {anomaly.severity.value}\n")
-                report.append(f"- Value: {anomaly.value}\n")
-                report.append(f"- Expected: {anomaly.expected_value:.2f}\n")
-                report.append(f"- Description: {anomaly.description}\n\n")
+                write(f"### {anomaly.metric_name}\n"
+                      f"- Severity: {anomaly.severity.value}\n"
+                      f"- Value: {anomaly.value}\n"
+                      f"- Expected: {anomaly.expected_value:.2f}\n"
+                      f"- Description: {anomaly.description}\n\n")
 
         # Recommendations Section
         recommendations = self.generate_recommendations()
         if recommendations:
-            report.append("## Recommendations\n")
+            write("## Recommendations\n")
             for rec in recommendations:
-                report.append(f"### [{rec['priority'].upper()}] {rec['title']}\n")
-                report.append(f"{rec['description']}\n\n")
+                write(f"### [{rec['priority'].upper()}] {rec['title']}\n"
+                      f"{rec['description']}\n\n")
 
-        return "".join(report)
+        return buf.getvalue()
 
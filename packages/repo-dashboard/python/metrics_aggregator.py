@@ -10,21 +10,50 @@ This module provides functionality to:
 - Store metrics history in SQLite
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import sqlite3
+import io
 import json
 import csv
+import operator
 import os
 from pathlib import Path
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+from issue_migrator import _TokenPool
+
+# orjson serializes dataclasses and datetimes natively and several
+# times faster than stdlib json; fall back silently when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+# Cap on concurrent per-repo metric fetches; GitHub API calls are
+# I/O-bound so threads overlap the network waits
+MAX_CONCURRENT_FETCHES = 10
+
+# Per-repo numeric/text fields in the order the INSERT column list and
+# the CSV header expect them; attrgetter extracts all ten in one
+# C-level call instead of ten LOAD_ATTRs per row
+_ROW_FIELDS = (
+    "repo_name", "health_score", "build_status", "test_coverage",
+    "open_issues", "stale_prs", "deployment_frequency", "lead_time",
+    "mttr", "change_failure_rate"
+)
+_row_tuple = operator.attrgetter(*_ROW_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RepositoryMetrics:
     """Data structure for repository-level metrics."""
     repo_name: str
@@ -41,7 +70,7 @@ class RepositoryMetrics:
     last_updated: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AggregatedMetrics:
     """Data structure for aggregated metrics across repositories."""
     timestamp: datetime
@@ -61,23 +90,64 @@ class MetricsAggregator:
 
         Args:
             org: GitHub organization name
-            github_token: GitHub API token (defaults to GITHUB_TOKEN env var)
+            github_token: GitHub API token, or a list of tokens to
+                rotate across for a larger combined rate limit
+                (defaults to GITHUB_TOKEN env var)
         """
         self.org = org
-        self.github_token = github_token or os.getenv("GITHUB_TOKEN")
+        token = github_token or os.getenv("GITHUB_TOKEN")
+        tokens = [token] if isinstance(token, str) or token is None else list(token)
+        self.github_token = tokens[0]
+        self._token_pool = _TokenPool(tokens) if len(tokens) > 1 else None
         self.base_url = "https://api.github.com"
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "Authorization": f"token {self.github_token}" if self.github_token else ""
         }
+        # Keep-alive session: concurrent per-repo fetches reuse pooled
+        # TLS connections instead of paying a handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=2 * MAX_CONCURRENT_FETCHES,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.db_path = Path(__file__).parent / "metrics_history.db"
+        self._conn: Optional[sqlite3.Connection] = None
         self._init_database()
 
     def _init_database(self) -> None:
-        """Initialize SQLite database for metrics history."""
-        conn = sqlite3.connect(self.db_path)
+        """Initialize SQLite database for metrics history.
+
+        Opens a long-lived connection (re-opening if db_path changed) so
+        reads and writes reuse one handle instead of reconnecting per
+        call. WAL mode lets readers proceed concurrently with writes,
+        and the remaining pragmas trade durability-on-power-loss for
+        fewer fsyncs and more in-memory caching.
+        """
+        if self._conn is not None:
+            self._conn.close()
+
+        # A large statement cache keeps the INSERT/SELECT statements
+        # prepared across calls instead of re-parsing the SQL each time;
+        # check_same_thread=False lets worker threads share the handle
+        conn = sqlite3.connect(
+            self.db_path,
+            cached_statements=256,
+            check_same_thread=False,
+        )
         cursor = conn.cursor()
-        
+
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA mmap_size=268435456")
+
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS metrics_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -98,28 +168,104 @@ class MetricsAggregator:
         """)
         
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_org_repo_timestamp 
+            CREATE INDEX IF NOT EXISTS idx_org_repo_timestamp
             ON metrics_history(organization, repository, timestamp)
         """)
-        
+
+        # Covering index for the trend query: the GROUP BY over
+        # (organization, timestamp) plus the averaged columns can be
+        # answered by an index scan without touching the table
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_org_ts_trends
+            ON metrics_history(organization, timestamp, health_score,
+                               build_status, test_coverage, deployment_frequency)
+        """)
+
         conn.commit()
-        conn.close()
+        self._conn = conn
+
+    def _graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Execute a query against the GitHub GraphQL (v4) API."""
+        payload: Dict = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        headers = None
+        if self._token_pool is not None:
+            headers = {"Authorization": f"token {self._token_pool.next()}"}
+
+        response = self.session.post(
+            f"{self.base_url}/graphql",
+            json=payload,
+            headers=headers,
+            timeout=30,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _batch_repository_counts(self, repos: List[str]) -> Dict[str, Dict[str, int]]:
+        """Fetch issue/PR counts for many repositories in one query.
 
-    def get_repository_metrics(self, repo: str) -> RepositoryMetrics:
+        Builds a single GraphQL query with per-repo aliases (repo0:,
+        repo1:, ...) so N repositories cost one HTTP round trip instead
+        of several REST calls each. Stale PRs are derived locally from
+        each PR's updatedAt rather than asked of the API.
+
+        Args:
+            repos: List of repository names
+
+        Returns:
+            Mapping of repo name to open_issues/open_prs/stale_prs counts
+        """
+        fields = [
+            f'repo{i}: repository(owner: "{self.org}", name: "{name}") {{'
+            ' issues(states: OPEN) { totalCount }'
+            ' pullRequests(states: OPEN, first: 100,'
+            ' orderBy: {field: UPDATED_AT, direction: ASC}) {'
+            ' totalCount nodes { updatedAt } } }'
+            for i, name in enumerate(repos)
+        ]
+        data = self._graphql("query { " + " ".join(fields) + " }").get("data") or {}
+
+        stale_cutoff = datetime.now() - timedelta(days=30)
+        counts = {}
+        for i, name in enumerate(repos):
+            node = data.get(f"repo{i}") or {}
+            prs = node.get("pullRequests") or {}
+            stale = sum(
+                1
+                for pr in prs.get("nodes") or []
+                if datetime.fromisoformat(pr["updatedAt"].rstrip("Z")) < stale_cutoff
+            )
+            counts[name] = {
+                "open_issues": (node.get("issues") or {}).get("totalCount", 0),
+                "open_prs": prs.get("totalCount", 0),
+                "stale_prs": stale,
+            }
+        return counts
+
+    def get_repository_metrics(self, repo: str,
+                               counts: Optional[Dict[str, int]] = None) -> RepositoryMetrics:
         """
         Get metrics for a single repository.
 
         Args:
             repo: Repository name
+            counts: Pre-fetched issue/PR counts (from the batched
+                GraphQL query); falls back to per-repo lookups if None
 
         Returns:
             RepositoryMetrics object with collected metrics
         """
         # Collect GitHub metrics
-        issues = self._get_open_issues(repo)
-        prs = self._get_open_prs(repo)
-        stale_prs = self._get_stale_prs(repo)
-        
+        if counts is not None:
+            issues = counts.get("open_issues", 0)
+            stale_prs = counts.get("stale_prs", 0)
+        else:
+            issues = self._get_open_issues(repo)
+            prs = self._get_open_prs(repo)
+            stale_prs = self._get_stale_prs(repo)
+
         # Calculate metrics
         health_score = self.calculate_health_score(repo)
         dora_metrics = self.calculate_dora_metrics(repo)
@@ -137,41 +283,81 @@ class MetricsAggregator:
             change_failure_rate=dora_metrics.get("change_failure_rate", 0.0),
         )
 
-    def aggregate_repository_metrics(self, repos: List[str]) -> AggregatedMetrics:
+    def aggregate_repository_metrics(self, repos: List[str],
+                                     use_graphql: bool = False) -> AggregatedMetrics:
         """
         Aggregate metrics for multiple repositories.
 
         Args:
             repos: List of repository names
+            use_graphql: If True, fetch issue/PR counts for all repos in
+                one batched GraphQL query instead of per-repo REST calls
 
         Returns:
             AggregatedMetrics object with aggregated data
         """
-        by_repository = {}
-        health_scores = []
-        
-        for repo in repos:
-            metrics = self.get_repository_metrics(repo)
-            by_repository[repo] = metrics
-            health_scores.append(metrics.health_score)
-            self._store_metrics(metrics)
-        
-        # Calculate summary metrics
+        batch_counts: Dict[str, Dict[str, int]] = {}
+        if use_graphql and repos and self.github_token:
+            try:
+                batch_counts = self._batch_repository_counts(repos)
+            except requests.RequestException:
+                batch_counts = {}
+
+        # Fetch repos concurrently; map() preserves input order so the
+        # result dict lines up with the repos list
+        if repos:
+            workers = min(MAX_CONCURRENT_FETCHES, len(repos))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                collected = list(pool.map(
+                    lambda repo: self.get_repository_metrics(repo, batch_counts.get(repo)),
+                    repos,
+                ))
+        else:
+            collected = []
+
+        by_repository = dict(zip(repos, collected))
+
+        # One clock read per run: the same instant stamps the stored
+        # rows and the returned AggregatedMetrics
+        run_time = datetime.now()
+
+        # One transaction for the whole batch instead of a
+        # connect/insert/commit cycle per repository
+        self._store_metrics_bulk(collected, timestamp=run_time.isoformat())
+
+        # Summary stats in one vectorized pass: pack the numeric fields
+        # into an (n_repos, 7) float table, then sum/mean by column
+        # instead of walking the metrics list once per stat
+        if collected:
+            table = np.fromiter(
+                (
+                    (m.open_issues, m.stale_prs, m.deployment_frequency,
+                     m.lead_time, m.mttr, m.change_failure_rate, m.health_score)
+                    for m in collected
+                ),
+                dtype=np.dtype((np.float64, 7)),
+                count=len(collected),
+            )
+            sums = table.sum(axis=0)
+            means = sums / len(collected)
+        else:
+            sums = means = np.zeros(7)
+
         summary = {
             "totalRepos": len(repos),
-            "healthScore": sum(health_scores) / len(health_scores) if health_scores else 0.0,
+            "healthScore": float(means[6]),
             "buildSuccessRate": 0.0,  # Would aggregate from repos
             "testCoverageAvg": 0.0,  # Would aggregate from repos
-            "openIssuesTotal": sum(m.open_issues for m in by_repository.values()),
-            "stalePRsTotal": sum(m.stale_prs for m in by_repository.values()),
-            "deploymentFrequency": sum(m.deployment_frequency for m in by_repository.values()) / len(repos) if repos else 0.0,
-            "leadTimeForChanges": sum(m.lead_time for m in by_repository.values()) / len(repos) if repos else 0.0,
-            "meanTimeToRecovery": sum(m.mttr for m in by_repository.values()) / len(repos) if repos else 0.0,
-            "changeFailureRate": sum(m.change_failure_rate for m in by_repository.values()) / len(repos) if repos else 0.0,
+            "openIssuesTotal": int(sums[0]),
+            "stalePRsTotal": int(sums[1]),
+            "deploymentFrequency": float(means[2]),
+            "leadTimeForChanges": float(means[3]),
+            "meanTimeToRecovery": float(means[4]),
+            "changeFailureRate": float(means[5]),
         }
         
         return AggregatedMetrics(
-            timestamp=datetime.now(),
+            timestamp=run_time,
             organization=self.org,
             summary=summary,
             by_repository=by_repository,
@@ -232,27 +418,32 @@ class MetricsAggregator:
         Returns:
             Dictionary with trend data
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        cursor = self._conn.cursor()
+
         since = datetime.now() - timedelta(days=days)
-        
+
+        # All four trends come back from one SQL pass; SQLite's
+        # aggregates run in C, so only one small row per day crosses
+        # into Python instead of every stored sample
         cursor.execute("""
-            SELECT timestamp, AVG(health_score) as avg_health
+            SELECT DATE(timestamp) AS day,
+                   AVG(health_score),
+                   AVG(CASE WHEN build_status = 'success' THEN 1.0 ELSE 0.0 END),
+                   AVG(test_coverage),
+                   AVG(deployment_frequency)
             FROM metrics_history
             WHERE organization = ? AND timestamp >= ?
-            GROUP BY DATE(timestamp)
-            ORDER BY timestamp
+            GROUP BY day
+            ORDER BY day
         """, (self.org, since.isoformat()))
-        
+
         rows = cursor.fetchall()
-        conn.close()
-        
+
         return {
-            "healthScoreTrend": [row[1] for row in rows] if rows else [],
-            "buildSuccessRateTrend": [],
-            "testCoverageTrend": [],
-            "deploymentFrequencyTrend": [],
+            "healthScoreTrend": [row[1] for row in rows],
+            "buildSuccessRateTrend": [row[2] for row in rows],
+            "testCoverageTrend": [row[3] for row in rows],
+            "deploymentFrequencyTrend": [row[4] for row in rows],
         }
 
     def export_metrics(self, metrics: AggregatedMetrics, format: str = "json") -> str:
@@ -275,6 +466,18 @@ class MetricsAggregator:
 
     def _export_json(self, metrics: AggregatedMetrics) -> str:
         """Export metrics to JSON format."""
+        if orjson is not None:
+            # orjson handles dataclasses and datetimes natively, so the
+            # RepositoryMetrics objects go in without an asdict() pass
+            data = {
+                "timestamp": metrics.timestamp,
+                "organization": metrics.organization,
+                "summary": metrics.summary,
+                "by_repository": metrics.by_repository,
+                "trends": metrics.trends,
+            }
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+
         data = {
             "timestamp": metrics.timestamp.isoformat(),
             "organization": metrics.organization,
@@ -286,61 +489,68 @@ class MetricsAggregator:
         }
         return json.dumps(data, indent=2, default=str)
 
+    def _write_csv(self, metrics: AggregatedMetrics, stream) -> None:
+        """Write metrics rows to a text stream via the csv module.
+
+        csv.writer handles quoting/stringification in C and writerows
+        consumes a lazy map, so no intermediate row strings are built.
+        """
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(_ROW_FIELDS)
+        writer.writerows(map(_row_tuple, metrics.by_repository.values()))
+
     def _export_csv(self, metrics: AggregatedMetrics) -> str:
         """Export metrics to CSV format."""
-        output = []
-        fieldnames = [
-            "repo_name", "health_score", "build_status", "test_coverage",
-            "open_issues", "stale_prs", "deployment_frequency", "lead_time",
-            "mttr", "change_failure_rate"
-        ]
-        
-        output.append(",".join(fieldnames))
-        for repo_name, repo_metrics in metrics.by_repository.items():
-            row = [
-                repo_metrics.repo_name,
-                repo_metrics.health_score,
-                repo_metrics.build_status,
-                repo_metrics.test_coverage,
-                repo_metrics.open_issues,
-                repo_metrics.stale_prs,
-                repo_metrics.deployment_frequency,
-                repo_metrics.lead_time,
-                repo_metrics.mttr,
-                repo_metrics.change_failure_rate,
-            ]
-            output.append(",".join(str(v) for v in row))
-        
-        return "\n".join(output)
+        buf = io.StringIO()
+        self._write_csv(metrics, buf)
+        return buf.getvalue().rstrip("\n")
+
+    def export_metrics_to_file(self, metrics: AggregatedMetrics, path: str) -> None:
+        """Stream metrics as CSV straight to a file.
+
+        Avoids materializing the whole document in memory the way
+        export_metrics(format="csv") does.
+
+        Args:
+            metrics: AggregatedMetrics object
+            path: Destination file path
+        """
+        with open(path, "w", newline="") as f:
+            self._write_csv(metrics, f)
 
     def _store_metrics(self, metrics: RepositoryMetrics) -> None:
         """Store metrics in SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        self._store_metrics_bulk([metrics])
+
+    def _store_metrics_bulk(self, metrics_list: List[RepositoryMetrics],
+                            timestamp: Optional[str] = None) -> None:
+        """Store a batch of metrics in a single transaction.
+
+        Uses one connection and one executemany/commit for the whole
+        batch, so SQLite pays a single fsync instead of one per repo.
+
+        Args:
+            metrics_list: Metrics to store
+            timestamp: ISO timestamp shared by the batch (defaults to now)
+        """
+        if not metrics_list:
+            return
+
+        now = timestamp or datetime.now().isoformat()
+        prefix = (now, self.org)
+        rows = (prefix + _row_tuple(m) for m in metrics_list)
+
+        cursor = self._conn.cursor()
+
+        cursor.executemany("""
             INSERT INTO metrics_history (
                 timestamp, organization, repository, health_score, build_status,
                 test_coverage, open_issues, stale_prs, deployment_frequency,
                 lead_time, mttr, change_failure_rate
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            datetime.now().isoformat(),
-            self.org,
-            metrics.repo_name,
-            metrics.health_score,
-            metrics.build_status,
-            metrics.test_coverage,
-            metrics.open_issues,
-            metrics.stale_prs,
-            metrics.deployment_frequency,
-            metrics.lead_time,
-            metrics.mttr,
-            metrics.change_failure_rate,
-        ))
-        
-        conn.commit()
-        conn.close()
+        """, rows)
+
+        self._conn.commit()
 
     def _get_open_issues(self, repo: str) -> int:
         """Get count of open issues for a repository."""
@@ -9,10 +9,18 @@ import os
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any
 from datetime import datetime
 import click
-from issue_migrator import migrate_issues
+from issue_migrator import GitHubAPIClient, migrate_issues
+
+# orjson writes the report in one fast serialization pass; fall back
+# silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -37,6 +45,10 @@ RENDERX_SOURCE_REPOS = [
 # Target repository
 TARGET_REPO = "BPMSoftwareSolutions/renderx-mono-repo"
 
+# Per-repo migrations are independent, so a few can run in parallel;
+# kept modest because they all share one GitHub rate limit
+MAX_CONCURRENT_REPOS = 4
+
 
 class BatchMigrator:
     """Manages batch migration of issues from multiple repositories."""
@@ -44,9 +56,17 @@ class BatchMigrator:
     def __init__(self, token: str, target_repo: str = TARGET_REPO):
         self.token = token
         self.target_repo = target_repo
+        # One client for the whole batch: its connection pool, ETag cache
+        # and rate-limit state carry over between repositories instead of
+        # paying a fresh TLS handshake per repo
+        self.client = GitHubAPIClient(token)
         self.results = {}
         self.start_time = None
         self.end_time = None
+        # Append-only progress log: one JSON line per finished repo, so
+        # a crash mid-run loses at most the repo in flight
+        self.progress_path = None
+        self._progress_file = None
     
     def migrate_from_repos(self, source_repos: List[str], dry_run: bool = False, 
                           limit_per_repo: int = 100, skip_repos: List[str] = None) -> Dict[str, Any]:
@@ -65,6 +85,10 @@ class BatchMigrator:
         
         self.start_time = datetime.now()
         skip_repos = skip_repos or []
+
+        ts = self.start_time.strftime("%Y%m%d_%H%M%S")
+        self.progress_path = f"migration_progress_{ts}.jsonl"
+        self._progress_file = open(self.progress_path, 'wb')
         
         logger.info(f"🚀 Starting batch migration to {self.target_repo}")
         logger.info(f"📊 Source repositories: {len(source_repos)}")
@@ -72,37 +96,60 @@ class BatchMigrator:
         
         total_migrated = 0
         total_failed = 0
-        
-        for i, source_repo in enumerate(source_repos, 1):
+
+        pending = []
+        for source_repo in source_repos:
             if source_repo in skip_repos:
-                logger.info(f"⏭️ [{i}/{len(source_repos)}] Skipping {source_repo}")
+                logger.info(f"⏭️ Skipping {source_repo}")
                 continue
-            
-            logger.info(f"📦 [{i}/{len(source_repos)}] Processing {source_repo}...")
-            
-            try:
-                summary = migrate_issues(
-                    source_repo=source_repo,
-                    target_repo=self.target_repo,
-                    token=self.token,
-                    dry_run=dry_run,
-                    limit=limit_per_repo
-                )
-                
-                self.results[source_repo] = summary
-                total_migrated += summary['migrated']
-                total_failed += summary['failed']
-                
-                logger.info(f"✅ {source_repo}: {summary['migrated']} migrated, {summary['failed']} failed")
-            
-            except Exception as e:
-                logger.error(f"❌ Error processing {source_repo}: {e}")
-                self.results[source_repo] = {
-                    'error': str(e),
-                    'migrated': 0,
-                    'failed': 0,
-                }
-        
+            pending.append(source_repo)
+
+        # Repos migrate independently, so fan out across a bounded
+        # worker pool; results are merged on this thread as futures
+        # complete, which keeps self.results and the counters lock-free
+        try:
+            if pending:
+                workers = min(MAX_CONCURRENT_REPOS, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(
+                            migrate_issues,
+                            source_repo=source_repo,
+                            target_repo=self.target_repo,
+                            token=self.token,
+                            dry_run=dry_run,
+                            limit=limit_per_repo,
+                            client=self.client
+                        ): source_repo
+                        for source_repo in pending
+                    }
+
+                    for i, future in enumerate(as_completed(futures), 1):
+                        source_repo = futures[future]
+
+                        try:
+                            summary = future.result()
+                        except Exception as e:
+                            logger.error(f"❌ Error processing {source_repo}: {e}")
+                            self.results[source_repo] = {
+                                'error': str(e),
+                                'migrated': 0,
+                                'failed': 0,
+                            }
+                            self._append_progress(source_repo, self.results[source_repo])
+                            continue
+
+                        self.results[source_repo] = summary
+                        total_migrated += summary['migrated']
+                        total_failed += summary['failed']
+                        self._append_progress(source_repo, summary)
+
+                        logger.info(f"✅ [{i}/{len(pending)}] {source_repo}: "
+                                    f"{summary['migrated']} migrated, {summary['failed']} failed")
+        finally:
+            self._progress_file.close()
+            self._progress_file = None
+
         self.end_time = datetime.now()
         
         return self._generate_report(total_migrated, total_failed)
@@ -127,16 +174,49 @@ class BatchMigrator:
         }
         
         return report
-    
+
+    def _append_progress(self, source_repo: str, summary: Dict[str, Any]) -> None:
+        """Append one per-repo result to the progress JSONL file.
+
+        Flushed and fsynced per record so the line survives a crash of
+        the process or the machine.
+        """
+        if self._progress_file is None:
+            return
+
+        record = {'repo': source_repo, 'summary': summary}
+        if orjson is not None:
+            line = orjson.dumps(record, default=str) + b"\n"
+        else:
+            line = (json.dumps(record, default=str) + "\n").encode()
+
+        self._progress_file.write(line)
+        self._progress_file.flush()
+        os.fsync(self._progress_file.fileno())
+
     def save_report(self, filename: str = None) -> str:
-        """Save migration report to file."""
-        
+        """Save migration report to file.
+
+        The report is assembled from the progress JSONL when present, so
+        results persisted before a crash are still reported.
+        """
+
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"migration_report_{timestamp}.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(self.results, f, indent=2)
+
+        results = self.results
+        if self.progress_path and os.path.exists(self.progress_path):
+            loads = orjson.loads if orjson is not None else json.loads
+            with open(self.progress_path, 'rb') as f:
+                results = {rec['repo']: rec['summary'] for rec in map(loads, f)}
+
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
         
         logger.info(f"📄 Report saved to {filename}")
         return filename
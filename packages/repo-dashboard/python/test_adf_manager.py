@@ -11,7 +11,6 @@ Tests cover:
 
 import pytest
 import json
-import tempfile
 import sys
 from pathlib import Path
 
@@ -113,10 +112,13 @@ def invalid_adf_bad_version():
 
 
 @pytest.fixture
-def temp_dir():
-    """Fixture providing a temporary directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_dir(tmp_path):
+    """Fixture providing a temporary directory.
+
+    Built on pytest's session tmp tree: one lightweight subdir per
+    test instead of a TemporaryDirectory create/rmtree cycle each.
+    """
+    return str(tmp_path)
 
 
 # Tests for load_adf
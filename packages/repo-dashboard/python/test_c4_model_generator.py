@@ -7,6 +7,7 @@ and JSON graph representation.
 
 import pytest
 import json
+import re
 import xml.etree.ElementTree as ET
 import sys
 from pathlib import Path
@@ -17,90 +18,121 @@ sys.path.insert(0, str(Path(__file__).parent))
 from c4_model_generator import C4ModelGenerator
 
 
-# Test fixtures
-@pytest.fixture
-def sample_adf():
-    """Sample ADF for testing."""
-    return {
-        "version": "1.0.0",
-        "architecture": {
-            "name": "Test Architecture",
-            "description": "A test architecture for C4 diagrams",
-            "c4Model": {
-                "level": "container",
-                "containers": [
-                    {
-                        "id": "web-app",
-                        "name": "Web Application",
-                        "type": "ui",
-                        "description": "User-facing web application",
-                        "repositories": ["repo-web"],
-                        "packages": [
-                            {"name": "@bpm/web-ui", "version": "1.0.0", "status": "stable"}
-                        ],
-                        "dependencies": ["api-service"],
-                        "metrics": {
-                            "healthScore": 0.95,
-                            "testCoverage": 0.85,
-                            "buildStatus": "success"
-                        }
-                    },
-                    {
-                        "id": "api-service",
-                        "name": "API Service",
-                        "type": "service",
-                        "description": "Backend API service",
-                        "repositories": ["repo-api"],
-                        "packages": [
-                            {"name": "@bpm/api-core", "version": "2.0.0", "status": "stable"}
-                        ],
-                        "dependencies": ["database"],
-                        "metrics": {
-                            "healthScore": 0.90,
-                            "testCoverage": 0.80,
-                            "buildStatus": "success"
-                        }
-                    },
-                    {
-                        "id": "database",
-                        "name": "Database",
-                        "type": "database",
-                        "description": "PostgreSQL database",
-                        "repositories": [],
-                        "packages": [],
-                        "dependencies": [],
-                        "metrics": {
-                            "healthScore": 0.98,
-                            "testCoverage": 0.0,
-                            "buildStatus": "success"
-                        }
+def assert_all_in(hay, needles):
+    """Assert every needle occurs in hay, scanning hay only once.
+
+    A single alternation regex pass replaces one substring scan per
+    needle; the assertion message lists exactly what was missing.
+    Alternatives match in listed order, so needles are sorted
+    longest-first to stop a short needle shadowing one it prefixes
+    (e.g. "graph" hiding "graphml"); any needle the scan still missed
+    (one occurring only inside a longer match) gets a direct substring
+    check before being reported.
+    """
+    ordered = sorted(needles, key=len, reverse=True)
+    pattern = re.compile('|'.join(map(re.escape, ordered)))
+    found = set(pattern.findall(hay))
+    missing = {n for n in needles if n not in found and n not in hay}
+    assert not missing, f"Missing from output: {missing}"
+
+
+# Built once at import; every test shares this document through the
+# session-scoped fixture below and must not mutate it
+_SAMPLE_ADF = {
+    "version": "1.0.0",
+    "architecture": {
+        "name": "Test Architecture",
+        "description": "A test architecture for C4 diagrams",
+        "c4Model": {
+            "level": "container",
+            "containers": [
+                {
+                    "id": "web-app",
+                    "name": "Web Application",
+                    "type": "ui",
+                    "description": "User-facing web application",
+                    "repositories": ["repo-web"],
+                    "packages": [
+                        {"name": "@bpm/web-ui", "version": "1.0.0", "status": "stable"}
+                    ],
+                    "dependencies": ["api-service"],
+                    "metrics": {
+                        "healthScore": 0.95,
+                        "testCoverage": 0.85,
+                        "buildStatus": "success"
                     }
-                ]
-            },
-            "relationships": [
+                },
                 {
-                    "from": "web-app",
-                    "to": "api-service",
-                    "type": "depends_on",
-                    "description": "Web app calls API"
+                    "id": "api-service",
+                    "name": "API Service",
+                    "type": "service",
+                    "description": "Backend API service",
+                    "repositories": ["repo-api"],
+                    "packages": [
+                        {"name": "@bpm/api-core", "version": "2.0.0", "status": "stable"}
+                    ],
+                    "dependencies": ["database"],
+                    "metrics": {
+                        "healthScore": 0.90,
+                        "testCoverage": 0.80,
+                        "buildStatus": "success"
+                    }
                 },
                 {
-                    "from": "api-service",
-                    "to": "database",
-                    "type": "depends_on",
-                    "description": "API reads/writes to database"
+                    "id": "database",
+                    "name": "Database",
+                    "type": "database",
+                    "description": "PostgreSQL database",
+                    "repositories": [],
+                    "packages": [],
+                    "dependencies": [],
+                    "metrics": {
+                        "healthScore": 0.98,
+                        "testCoverage": 0.0,
+                        "buildStatus": "success"
+                    }
                 }
             ]
-        }
+        },
+        "relationships": [
+            {
+                "from": "web-app",
+                "to": "api-service",
+                "type": "depends_on",
+                "description": "Web app calls API"
+            },
+            {
+                "from": "api-service",
+                "to": "database",
+                "type": "depends_on",
+                "description": "API reads/writes to database"
+            }
+        ]
     }
+}
+
+
+@pytest.fixture(scope="session")
+def sample_adf():
+    """Sample ADF shared by the whole module; tests must not mutate it."""
+    return _SAMPLE_ADF
+
+
+@pytest.fixture(scope="session")
+def generator(sample_adf):
+    """One generator for every read-only test.
+
+    The generate_* methods do not mutate the generator, so building it
+    once per session avoids re-walking the ADF dict for each test.
+    """
+    return C4ModelGenerator(sample_adf)
 
 
 class TestC4ModelGeneratorInit:
     """Test C4ModelGenerator initialization."""
 
-    def test_init_with_valid_adf(self, sample_adf):
+    def test_init_with_valid_adf(self, generator):
         """Test initialization with valid ADF."""
-        generator = C4ModelGenerator(sample_adf)
         assert generator.name == "Test Architecture"
         assert generator.description == "A test architecture for C4 diagrams"
         assert len(generator.containers) == 3
@@ -120,44 +152,23 @@ class TestC4ModelGeneratorInit:
 class TestMermaidGeneration:
     """Test Mermaid diagram generation."""
 
-    def test_generate_mermaid_container_level(self, sample_adf):
-        """Test Mermaid container level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_mermaid("container")
-
-        assert "graph TB" in diagram
-        assert "Web Application" in diagram
-        assert "API Service" in diagram
-        assert "Database" in diagram
-        assert "depends_on" in diagram
-
-    def test_generate_mermaid_system_level(self, sample_adf):
-        """Test Mermaid system level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_mermaid("system")
-
-        assert "graph TB" in diagram
-        assert "Test Architecture" in diagram
-
-    def test_generate_mermaid_component_level(self, sample_adf):
-        """Test Mermaid component level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_mermaid("component")
-
-        assert "graph TB" in diagram
-        assert "Component" in diagram or "subgraph" in diagram
-
-    def test_generate_mermaid_code_level(self, sample_adf):
-        """Test Mermaid code level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_mermaid("code")
-
-        assert "graph TB" in diagram
-        assert "Code Level" in diagram or "📦" in diagram
-
-    def test_generate_mermaid_invalid_level(self, sample_adf):
+    @pytest.mark.parametrize("level,expected_tokens,any_of", [
+        ("container", ["graph TB", "Web Application", "API Service",
+                       "Database", "depends_on"], None),
+        ("system", ["graph TB", "Test Architecture"], None),
+        ("component", ["graph TB"], ["Component", "subgraph"]),
+        ("code", ["graph TB"], ["Code Level", "📦"]),
+    ])
+    def test_generate_mermaid_level(self, generator, level, expected_tokens, any_of):
+        """Test Mermaid diagram generation at each C4 level."""
+        diagram = generator.generate_mermaid(level)
+
+        assert_all_in(diagram, expected_tokens)
+        if any_of:
+            assert any(token in diagram for token in any_of)
+
+    def test_generate_mermaid_invalid_level(self, generator):
         """Test Mermaid with invalid level raises error."""
-        generator = C4ModelGenerator(sample_adf)
         with pytest.raises(ValueError, match="Invalid level"):
             generator.generate_mermaid("invalid")
 
@@ -165,44 +176,21 @@ class TestMermaidGeneration:
 class TestPlantUMLGeneration:
     """Test PlantUML diagram generation."""
 
-    def test_generate_plantuml_container_level(self, sample_adf):
-        """Test PlantUML container level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_plantuml("container")
-
-        assert "@startuml" in diagram
-        assert "@enduml" in diagram
-        assert "Container" in diagram
-        assert "Test Architecture" in diagram
-
-    def test_generate_plantuml_system_level(self, sample_adf):
-        """Test PlantUML system level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_plantuml("system")
-
-        assert "@startuml" in diagram
-        assert "@enduml" in diagram
-        assert "System" in diagram
-
-    def test_generate_plantuml_component_level(self, sample_adf):
-        """Test PlantUML component level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_plantuml("component")
-
-        assert "@startuml" in diagram
-        assert "@enduml" in diagram
-
-    def test_generate_plantuml_code_level(self, sample_adf):
-        """Test PlantUML code level diagram generation."""
-        generator = C4ModelGenerator(sample_adf)
-        diagram = generator.generate_plantuml("code")
+    @pytest.mark.parametrize("level,expected_tokens", [
+        ("container", ["@startuml", "@enduml", "Container",
+                       "Test Architecture"]),
+        ("system", ["@startuml", "@enduml", "System"]),
+        ("component", ["@startuml", "@enduml"]),
+        ("code", ["@startuml", "@enduml"]),
+    ])
+    def test_generate_plantuml_level(self, generator, level, expected_tokens):
+        """Test PlantUML diagram generation at each C4 level."""
+        diagram = generator.generate_plantuml(level)
 
-        assert "@startuml" in diagram
-        assert "@enduml" in diagram
+        assert_all_in(diagram, expected_tokens)
 
-    def test_generate_plantuml_invalid_level(self, sample_adf):
+    def test_generate_plantuml_invalid_level(self, generator):
         """Test PlantUML with invalid level raises error."""
-        generator = C4ModelGenerator(sample_adf)
         with pytest.raises(ValueError, match="Invalid level"):
             generator.generate_plantuml("invalid")
 
@@ -210,44 +198,40 @@ class TestPlantUMLGeneration:
 class TestGraphMLGeneration:
     """Test GraphML export."""
 
-    def test_generate_graphml_with_metrics(self, sample_adf):
+    def test_generate_graphml_with_metrics(self, generator):
         """Test GraphML generation with metrics."""
-        generator = C4ModelGenerator(sample_adf)
         graphml = generator.generate_graphml(include_metrics=True)
 
-        assert "graphml" in graphml
-        assert "graph" in graphml
-        assert "node" in graphml
-        assert "edge" in graphml
-        assert "healthScore" in graphml
+        assert_all_in(graphml, ["graphml", "graph", "node", "edge",
+                                "healthScore"])
 
-    def test_generate_graphml_without_metrics(self, sample_adf):
+    def test_generate_graphml_without_metrics(self, generator):
         """Test GraphML generation without metrics."""
-        generator = C4ModelGenerator(sample_adf)
         graphml = generator.generate_graphml(include_metrics=False)
 
-        assert "graphml" in graphml
-        assert "graph" in graphml
-        assert "node" in graphml
-        assert "edge" in graphml
+        assert_all_in(graphml, ["graphml", "graph", "node", "edge"])
 
-    def test_graphml_is_valid_xml(self, sample_adf):
+    def test_graphml_is_valid_xml(self, generator):
         """Test that generated GraphML is valid XML."""
-        generator = C4ModelGenerator(sample_adf)
         graphml = generator.generate_graphml()
 
-        # Should not raise an exception
-        root = ET.fromstring(graphml)
-        # Check that the tag contains 'graphml' (accounting for namespace)
-        assert "graphml" in root.tag
+        # Incremental parse: stop at the root start tag instead of
+        # building a full tree just to inspect one attribute
+        parser = ET.XMLPullParser(['start'])
+        parser.feed(graphml)
+        for _event, elem in parser.read_events():
+            # Check that the tag contains 'graphml' (accounting for namespace)
+            assert "graphml" in elem.tag
+            break
+        else:
+            pytest.fail("No XML root element found in GraphML output")
 
 
 class TestJSONGraphGeneration:
     """Test JSON graph representation."""
 
-    def test_generate_json_graph(self, sample_adf):
+    def test_generate_json_graph(self, generator):
         """Test JSON graph generation."""
-        generator = C4ModelGenerator(sample_adf)
         graph = generator.generate_json_graph()
 
         assert "nodes" in graph
@@ -256,9 +240,8 @@ class TestJSONGraphGeneration:
         assert len(graph["nodes"]) == 3
         assert len(graph["edges"]) == 2
 
-    def test_json_graph_nodes_structure(self, sample_adf):
+    def test_json_graph_nodes_structure(self, generator):
         """Test JSON graph nodes have correct structure."""
-        generator = C4ModelGenerator(sample_adf)
         graph = generator.generate_json_graph()
 
         for node in graph["nodes"]:
@@ -268,9 +251,8 @@ class TestJSONGraphGeneration:
             assert "description" in node
             assert "metrics" in node
 
-    def test_json_graph_edges_structure(self, sample_adf):
+    def test_json_graph_edges_structure(self, generator):
         """Test JSON graph edges have correct structure."""
-        generator = C4ModelGenerator(sample_adf)
         graph = generator.generate_json_graph()
 
         for edge in graph["edges"]:
@@ -279,9 +261,8 @@ class TestJSONGraphGeneration:
             assert "type" in edge
             assert "label" in edge
 
-    def test_json_graph_metadata(self, sample_adf):
+    def test_json_graph_metadata(self, generator):
         """Test JSON graph metadata."""
-        generator = C4ModelGenerator(sample_adf)
         graph = generator.generate_json_graph()
 
         assert graph["metadata"]["name"] == "Test Architecture"
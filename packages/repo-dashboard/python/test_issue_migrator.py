@@ -2,6 +2,8 @@
 Unit tests for issue_migrator module
 """
 
+import re
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from issue_migrator import (
@@ -82,6 +84,97 @@ class TestIssueExtractor:
         assert len(issues) == 150
 
 
+def _issues(start, count):
+    """Build a page of numbered fake issues."""
+    return [{"number": n, "title": f"Issue {n}"} for n in range(start, start + count)]
+
+
+class _FakeClient:
+    """Minimal GitHubAPIClient stand-in serving canned issue pages."""
+
+    def __init__(self, pages, last_page=None):
+        self._pages = pages
+        self.requested_pages = []
+        self.last_response_headers = {}
+        if last_page:
+            self.last_response_headers = {
+                "Link": (f"<https://api.github.com/repos/o/r/issues"
+                         f"?per_page=100&page={last_page}>; rel=\"last\"")
+            }
+
+    def get(self, endpoint):
+        page = int(re.search(r"[?&]page=(\d+)", endpoint).group(1))
+        self.requested_pages.append(page)
+        return self._pages.get(page, [])
+
+
+class TestIterIssuesPagination:
+    """Tests for the iter_issues pagination engine."""
+
+    def test_link_header_fans_out_remaining_pages(self):
+        """With a Link header, every named page is fetched and yielded in order."""
+        pages = {1: _issues(1, 100), 2: _issues(101, 100), 3: _issues(201, 50)}
+        client = _FakeClient(pages, last_page=3)
+        extractor = IssueExtractor(client)
+
+        issues = list(extractor.iter_issues("owner/repo", limit=300))
+
+        assert [i["number"] for i in issues] == list(range(1, 251))
+        assert sorted(client.requested_pages) == [1, 2, 3]
+
+    def test_no_link_header_pages_serially(self):
+        """Without a Link header, pages are walked serially until a short page."""
+        pages = {1: _issues(1, 100), 2: _issues(101, 100), 3: _issues(201, 50)}
+        client = _FakeClient(pages)
+        extractor = IssueExtractor(client)
+
+        issues = list(extractor.iter_issues("owner/repo", limit=300))
+
+        assert [i["number"] for i in issues] == list(range(1, 251))
+        assert client.requested_pages == [1, 2, 3]
+
+    def test_short_first_page_stops_after_one_request(self):
+        """A first page below per_page ends pagination immediately."""
+        client = _FakeClient({1: _issues(1, 3)})
+        extractor = IssueExtractor(client)
+
+        issues = list(extractor.iter_issues("owner/repo", limit=100))
+
+        assert len(issues) == 3
+        assert client.requested_pages == [1]
+
+    def test_limit_below_page_size(self):
+        """limit < 100 becomes per_page, so one full page satisfies it."""
+        client = _FakeClient({1: _issues(1, 30), 2: _issues(31, 30)}, last_page=5)
+        extractor = IssueExtractor(client)
+
+        issues = list(extractor.iter_issues("owner/repo", limit=30))
+
+        assert len(issues) == 30
+        assert client.requested_pages == [1]
+
+    def test_limit_at_page_size(self):
+        """A limit of exactly one page never requests a second page."""
+        client = _FakeClient({1: _issues(1, 100), 2: _issues(101, 100)}, last_page=2)
+        extractor = IssueExtractor(client)
+
+        issues = list(extractor.iter_issues("owner/repo", limit=100))
+
+        assert len(issues) == 100
+        assert client.requested_pages == [1]
+
+    def test_limit_caps_link_fanout(self):
+        """The Link fan-out stops at ceil(limit / per_page) pages."""
+        pages = {p: _issues((p - 1) * 100 + 1, 100) for p in range(1, 6)}
+        client = _FakeClient(pages, last_page=5)
+        extractor = IssueExtractor(client)
+
+        issues = list(extractor.iter_issues("owner/repo", limit=150))
+
+        assert [i["number"] for i in issues] == list(range(1, 151))
+        assert sorted(client.requested_pages) == [1, 2]
+
+
 class TestIssueTransformer:
     """Tests for IssueTransformer."""
     
@@ -268,7 +361,7 @@ class TestMigrateIssuesIntegration:
         assert summary["migrated"] == 1
         assert summary["failed"] == 0
     
-    @patch('issue_migrator.IssueExtractor.fetch_issues')
+    @patch('issue_migrator.IssueExtractor.iter_issues')
     def test_migrate_issues_skip_prs(self, mock_fetch):
         """Test that pull requests are skipped."""
         mock_fetch.return_value = [
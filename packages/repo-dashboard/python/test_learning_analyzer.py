@@ -367,6 +367,72 @@ class TestAnalyzePatterns:
         assert len(result["trends"]) > 0
 
 
+class TestAnalyzePatternsRolling:
+    """Tests for the rolling-window analyze_patterns_rolling method."""
+
+    def test_rolling_empty_history(self):
+        """Test rolling analysis with empty history."""
+        analyzer = LearningAnalyzer([])
+        result = analyzer.analyze_patterns_rolling(window=5)
+
+        assert result["anomalies"] == []
+        assert result["correlations"] == []
+
+    def test_rolling_spike_flagged_once(self):
+        """Test that an injected spike is the only flagged anomaly."""
+        values = [10, 11, 10, 12, 11, 100, 10, 11, 10, 12, 11]
+        metrics_history = [
+            {"timestamp": datetime.now(), "metric1": v} for v in values
+        ]
+        analyzer = LearningAnalyzer(metrics_history)
+        result = analyzer.analyze_patterns_rolling(window=5)
+
+        assert len(result["anomalies"]) == 1
+        anomaly = result["anomalies"][0]
+        assert anomaly["metric_name"] == "metric1"
+        assert anomaly["value"] == 100
+
+    def test_rolling_level_shift_not_flagged_outside_window(self):
+        """Test that a level shift is flagged only where its window sees it.
+
+        Once the window has moved past the shift the new level is the
+        rolling norm, so the later values must not be reported even
+        though they are far from the series-wide mean.
+        """
+        values = [10] * 8 + [50] * 8
+        metrics_history = [
+            {"timestamp": datetime.now(), "metric1": v} for v in values
+        ]
+        analyzer = LearningAnalyzer(metrics_history)
+        result = analyzer.analyze_patterns_rolling(window=5)
+
+        assert len(result["anomalies"]) == 1
+        assert result["anomalies"][0]["value"] == 50
+
+    def test_rolling_lagged_correlation(self):
+        """Test that a one-snapshot lag surfaces a leading indicator."""
+        leader = [1, 5, 2, 8, 3, 9, 4, 7, 2, 6]
+        # metric2 follows metric1 exactly one snapshot later
+        follower = [0] + [2 * v for v in leader[:-1]]
+        metrics_history = [
+            {"timestamp": datetime.now(), "metric1": a, "metric2": b}
+            for a, b in zip(leader, follower)
+        ]
+        analyzer = LearningAnalyzer(metrics_history)
+        result = analyzer.analyze_patterns_rolling(window=10, lag=1)
+
+        pairs = {(c["metric1"], c["metric2"]): c for c in result["correlations"]}
+        lagged = pairs[("metric1", "metric2")]
+        assert lagged["correlation_coefficient"] > 0.99
+        assert lagged["is_leading_indicator"] is True
+
+        # Without the lag the pair must not look perfectly correlated
+        unlagged = LearningAnalyzer(metrics_history).analyze_patterns_rolling(window=10)
+        for corr in unlagged["correlations"]:
+            if (corr["metric1"], corr["metric2"]) == ("metric1", "metric2"):
+                assert corr["correlation_coefficient"] < 0.99
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 